@@ -150,7 +150,10 @@ def init_components(config: dict) -> dict:
         sys.exit(1)
 
     # Audio processor (VAD)
-    processor = AudioProcessor(vad_threshold=vad_cfg.get("threshold", 0.5))
+    processor = AudioProcessor(
+        vad_threshold=vad_cfg.get("threshold", 0.5),
+        use_onnx=vad_cfg.get("onnx", False),
+    )
     if not processor.load_vad_model():
         logger.error("Failed to load VAD model. Exiting.")
         device.close()
@@ -11,7 +11,7 @@ class AudioProcessor:
     Handles audio signal processing including resampling and VAD.
     
     Usage:
-        processor = AudioProcessor(vad_threshold=0.5)
+        processor = AudioProcessor(vad_threshold=0.5)  # use_onnx=True for ONNX Runtime
         
         # Resample audio
         resampled = processor.resample(audio_bytes, 48000, 16000)
@@ -24,8 +24,9 @@ class AudioProcessor:
     VAD_WINDOW_SIZE = 512  # Samples at 16kHz (32ms)
     VAD_SAMPLE_RATE = 16000
     
-    def __init__(self, vad_threshold: float = 0.5):
+    def __init__(self, vad_threshold: float = 0.5, use_onnx: bool = False):
         self.vad_threshold = vad_threshold
+        self.use_onnx = use_onnx  # ONNX Runtime Silero (faster on ARM, needs onnxruntime)
         self._vad_model = None
         self._vad_utils = None
     
@@ -33,7 +34,24 @@ class AudioProcessor:
         """
         Load the Silero VAD model.
         Returns True on success, False on failure.
+        
+        With use_onnx, tries the ONNX Runtime build first and falls back
+        to the TorchScript model if onnxruntime isn't available.
         """
+        if self.use_onnx:
+            try:
+                print("Loading Silero VAD model (ONNX Runtime)...")
+                self._vad_model, self._vad_utils = torch.hub.load(
+                    repo_or_dir='snakers4/silero-vad',
+                    model='silero_vad',
+                    force_reload=False,
+                    onnx=True
+                )
+                print("Silero VAD model loaded (ONNX Runtime).")
+                return True
+            except Exception as e:
+                print(f"[WARN] ONNX VAD unavailable, falling back to TorchScript: {e}")
+        
         try:
             print("Loading Silero VAD model...")
             self._vad_model, self._vad_utils = torch.hub.load(
@@ -98,7 +116,10 @@ class AudioProcessor:
         
         try:
             # Convert bytes to float32 normalized to [-1, 1]
-            samples = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            # (one scaled cast from the zero-copy int16 view, no intermediate float copy)
+            samples = np.multiply(
+                np.frombuffer(audio_bytes, dtype=np.int16), 1.0 / 32768.0, dtype=np.float32
+            )
             
             if len(samples) < self.VAD_WINDOW_SIZE:
                 # Too short for even one window
@@ -150,7 +171,9 @@ class AudioProcessor:
             return 0.0
         
         try:
-            samples = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            samples = np.multiply(
+                np.frombuffer(audio_bytes, dtype=np.int16), 1.0 / 32768.0, dtype=np.float32
+            )
             
             if len(samples) < self.VAD_WINDOW_SIZE:
                 return 0.0
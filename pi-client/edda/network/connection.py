@@ -6,7 +6,7 @@ import base64
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import AsyncGenerator, Optional, Callable, Any
+from typing import AsyncGenerator, Iterable, Optional, Callable, Any
 import websockets
 
 
@@ -125,6 +125,11 @@ class ServerConnection:
                     play(msg.audio.data)
     """
 
+    # Raw PCM per audio_chunk message. The server reads each message with a
+    # single 16 KB receive; 8 KB of PCM is ~11 KB as base64 JSON. Even, so
+    # int16 samples are never split across messages.
+    MAX_AUDIO_MESSAGE_BYTES = 8192
+
     def __init__(self, server_url: str):
         """
         Initialize the connection.
@@ -177,6 +182,30 @@ class ServerConnection:
             print(f"[ERROR] Failed to send audio chunk: {e}")
             return False
 
+    async def send_audio_chunks(self, websocket, chunks: Iterable[bytes]) -> bool:
+        """
+        Send several audio chunks to the server in as few messages as fit.
+
+        The server appends every audio_chunk payload to one PCM buffer, so
+        consecutive chunks can be concatenated without any framing. This
+        pays the JSON/base64/WebSocket overhead once per message instead of
+        per chunk (e.g. the pre-buffer flushed on speech start), with each
+        message capped at MAX_AUDIO_MESSAGE_BYTES of PCM.
+
+        Args:
+            websocket: Active WebSocket connection
+            chunks: Raw PCM audio chunks, in capture order
+
+        Returns:
+            True if sent successfully (or nothing to send), False otherwise
+        """
+        audio_data = b"".join(chunks)
+        step = self.MAX_AUDIO_MESSAGE_BYTES
+        for start in range(0, len(audio_data), step):
+            if not await self.send_audio_chunk(websocket, audio_data[start:start + step]):
+                return False
+        return True
+
     async def send_end_speech(self, websocket) -> bool:
         """
         Signal end of speech to the server.
@@ -3,9 +3,16 @@ Input pipeline - captures audio, runs VAD, streams speech to server.
 """
 
 import asyncio
-from datetime import datetime
+import logging
+import math
+import threading
+import time
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
+
+from .detector import SpeechEvent
+
 if TYPE_CHECKING:
     from ..audio import AudioDevice, AudioProcessor, EchoCanceller
     from ..audio.device import AudioStallError
@@ -13,6 +20,8 @@ if TYPE_CHECKING:
     from ..network import ServerConnection
     from .detector import SpeechDetector
 
+logger = logging.getLogger(__name__)
+
 
 class InputPipeline:
     """
@@ -29,6 +38,11 @@ class InputPipeline:
     DUCK_TRIGGER_COUNT = 3
     # Number of consecutive non-triggers before restoring volume
     RESTORE_SILENCE_COUNT = 5
+    # Max captured chunks buffered between the capture thread and the event loop
+    # (oldest are dropped beyond this, like a PortAudio overflow)
+    CAPTURE_QUEUE_SIZE = 64
+    # Max VAD log lines per second during playback (token bucket, also the burst size)
+    VAD_LOG_MAX_PER_SEC = 5.0
     
     def __init__(
         self,
@@ -48,13 +62,23 @@ class InputPipeline:
         self._echo_canceller = echo_canceller
         self._audio_player = audio_player
         
-        # Consecutive trigger tracking for volume ducking
-        self._consecutive_triggers = 0
-        self._consecutive_silence = 0
+        # Volume ducking state: signed score climbs on triggers (capped at
+        # DUCK_TRIGGER_COUNT) and falls on silence (floored at _restore_score).
+        # _ducked mirrors the player's state after each duck/restore attempt
+        # (cleared when playback stops, even if that restore failed).
+        self._duck_score = 0
+        self._restore_score = self.DUCK_TRIGGER_COUNT - self.RESTORE_SILENCE_COUNT
+        self._ducked = False
         
         # VAD state tracking for sparse logging (avoid spam)
         # Uses hysteresis: need to go above 0.5 before "drop below 0.3" logs again
         self._vad_log_armed = False  # True = we've gone high enough to log next drop
+        self._log_budget = self.VAD_LOG_MAX_PER_SEC
+        self._log_budget_time = time.monotonic()
+        
+        # Reusable int32 buffer for the sum-of-squares level calculation
+        # (sized lazily to the resampled chunk length, reallocated if it changes)
+        self._scratch_i32 = None
     
     async def run(self, websocket, playback_event: asyncio.Event) -> None:
         """
@@ -69,14 +93,13 @@ class InputPipeline:
             RuntimeError: If stream fails to open
         """
         from ..audio.device import AudioStallError
-        from .detector import SpeechEvent
         
         stream = self._device.open_input_stream()
         if stream is None:
             raise RuntimeError("Failed to open audio stream")
         
         config = self._device.config
-        last_audio_time = datetime.now()
+        last_audio_time = time.monotonic()
         
         # Log startup with echo cancellation status
         if self._echo_canceller is not None:
@@ -90,19 +113,39 @@ class InputPipeline:
         else:
             print("Listening for speech... (mic will mute during playback)")
         
+        # Dedicated capture thread blocks on stream.read and hands chunks to the
+        # event loop, instead of submitting every read to the default executor
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop_capture = threading.Event()
+        capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(stream, config.chunk_size, loop, queue, stop_capture),
+            name="audio-capture",
+            daemon=True,
+        )
+        capture_thread.start()
+        
+        # Config is fixed for the lifetime of the loop - bind once
+        ec_on = config.echo_cancellation
+        
         try:
             while True:
                 # Legacy mode: pause during playback if EC is disabled
-                if not config.echo_cancellation and playback_event.is_set():
+                # (discard what the capture thread read while muted)
+                # With EC on this short-circuits, leaving one is_set() per chunk
+                if not ec_on and playback_event.is_set():
+                    while not queue.empty():
+                        queue.get_nowait()
                     await asyncio.sleep(0.05)
                     continue
                 
                 # Read audio with stall detection
                 try:
-                    data = await self._read_audio(stream, config.chunk_size)
-                    last_audio_time = datetime.now()
+                    data = await self._read_audio(queue)
+                    last_audio_time = time.monotonic()
                 except asyncio.TimeoutError:
-                    stall = (datetime.now() - last_audio_time).total_seconds()
+                    stall = time.monotonic() - last_audio_time
                     raise AudioStallError(f"Audio device stalled for {stall:.1f}s")
                 
                 # Process through VAD and state machine
@@ -111,28 +154,96 @@ class InputPipeline:
                 await self._process_chunk(websocket, data, config, is_playing)
                 
         finally:
+            stop_capture.set()
+            # A read returns within one chunk; don't hang here if the device stalled
+            capture_thread.join(timeout=1.0)
             self._device.close_stream()
     
-    async def _read_audio(self, stream, chunk_size: int) -> bytes:
-        """Read audio chunk with timeout."""
-        loop = asyncio.get_event_loop()
-        return await asyncio.wait_for(
-            loop.run_in_executor(
-                None,
-                lambda: stream.read(chunk_size, exception_on_overflow=False),
-            ),
-            timeout=self._stall_timeout,
+    def _capture_loop(
+        self,
+        stream,
+        chunk_size: int,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """Capture thread: read chunks until stopped and push them onto the queue."""
+        while not stop.is_set():
+            try:
+                item = stream.read(chunk_size, exception_on_overflow=False)
+            except Exception as e:
+                # Surface read errors to run() (ignored once we're shutting down)
+                item = e
+            
+            if stop.is_set():
+                return
+            
+            try:
+                loop.call_soon_threadsafe(self._enqueue_chunk, queue, item)
+            except RuntimeError:
+                # Event loop already closed
+                return
+            
+            if isinstance(item, Exception):
+                return
+    
+    def _enqueue_chunk(self, queue: asyncio.Queue, item) -> None:
+        """Add a captured chunk on the event loop, dropping the oldest if full."""
+        if queue.qsize() >= self.CAPTURE_QUEUE_SIZE:
+            queue.get_nowait()
+        queue.put_nowait(item)
+    
+    async def _read_audio(self, queue: asyncio.Queue) -> bytes:
+        """Wait for the next captured chunk with timeout."""
+        item = await asyncio.wait_for(queue.get(), timeout=self._stall_timeout)
+        if isinstance(item, Exception):
+            raise item
+        return item
+    
+    def _take_log_budget(self) -> bool:
+        """Spend one VAD log token if available (refills at VAD_LOG_MAX_PER_SEC)."""
+        now = time.monotonic()
+        self._log_budget = min(
+            self.VAD_LOG_MAX_PER_SEC,
+            self._log_budget + (now - self._log_budget_time) * self.VAD_LOG_MAX_PER_SEC,
         )
+        self._log_budget_time = now
+        
+        if self._log_budget < 1.0:
+            return False
+        self._log_budget -= 1.0
+        return True
+    
+    def _compute_db(self, pcm: bytes) -> float:
+        """
+        Calculate audio level (RMS in dB relative to full scale).
+        
+        Only called when a VAD log line is emitted - nothing else reads the level.
+        """
+        # Square the int16 view into a reused int32 buffer (int16^2 always fits)
+        # instead of allocating a float32 copy and its square every call
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        n = samples.size
+        if n > 0:
+            if self._scratch_i32 is None or self._scratch_i32.size != n:
+                self._scratch_i32 = np.empty(n, dtype=np.int32)
+            np.multiply(samples, samples, out=self._scratch_i32, dtype=np.int32)
+            rms = math.sqrt(int(self._scratch_i32.sum(dtype=np.int64)) / n)
+        else:
+            rms = 0.0
+        return 20 * math.log10(rms / 32768 + 1e-10)
     
     async def _process_chunk(self, websocket, data: bytes, config, is_playing: bool = False) -> None:
         """Resample, apply AEC, run VAD, update state machine, send if needed."""
-        from .detector import SpeechEvent
-        import numpy as np
+        # Bind per-chunk config lookups to locals once
+        ec_on = config.echo_cancellation
+        thr_n = config.vad_threshold_normal
+        thr_p = config.vad_threshold_playback
+        tgt = config.target_rate
+        cap = config.capture_rate
         
         # Resample to target rate (16kHz for VAD/AEC)
-        resampled = self._processor.resample(
-            data, config.capture_rate, config.target_rate
-        )
+        resampled = self._processor.resample(data, cap, tgt)
         
         # Apply AEC if available and we have reference audio
         # This removes the speaker audio (TTS playback) from the mic input
@@ -141,55 +252,54 @@ class InputPipeline:
             resampled = self._echo_canceller.cancel_echo(resampled)
             aec_applied = True
         
-        # Calculate audio level (RMS in dB)
-        samples = np.frombuffer(resampled, dtype=np.int16).astype(np.float32)
-        rms = np.sqrt(np.mean(samples ** 2)) if len(samples) > 0 else 0
-        db = 20 * np.log10(rms / 32768 + 1e-10)  # dB relative to full scale
-        
         # Run VAD on the (possibly AEC-processed) audio
-        speech_prob = self._processor.detect_speech(resampled, config.target_rate)
+        speech_prob = self._processor.detect_speech(resampled, tgt)
         
         # Use elevated threshold during playback as a safety net
         # With AEC active, this threshold can be lower since echo should be cancelled
-        if config.echo_cancellation and is_playing:
+        if ec_on and is_playing:
             if aec_applied:
                 # AEC is doing the heavy lifting - use a moderate threshold
-                threshold = config.vad_threshold_normal + 0.20
+                threshold = thr_n + 0.20
             else:
                 # No AEC - rely on high threshold to filter speaker audio
-                threshold = config.vad_threshold_playback
+                threshold = thr_p
         else:
-            threshold = config.vad_threshold_normal
+            threshold = thr_n
         
         is_speech = speech_prob > threshold
         
-        # Track consecutive triggers for volume ducking during playback
+        # Track triggers for volume ducking during playback
         # Only interact with volume when state actually changes to avoid subprocess spam
-        if is_playing and self._audio_player is not None:
-            if is_speech:
-                self._consecutive_triggers += 1
-                self._consecutive_silence = 0
-                
-                # Duck volume after sustained triggers (only if not already ducked)
-                if self._consecutive_triggers == self.DUCK_TRIGGER_COUNT:
-                    self._audio_player.duck_volume(duck_percent=25)
-            else:
-                self._consecutive_silence += 1
-                # Don't reset trigger count immediately - let it decay
-                if self._consecutive_silence > 0:
-                    self._consecutive_triggers = max(0, self._consecutive_triggers - 1)
-                
-                # Restore volume after sustained silence (only if ducked)
-                if self._consecutive_silence == self.RESTORE_SILENCE_COUNT and self._audio_player.is_volume_ducked:
-                    self._audio_player.restore_volume()
-        elif not is_playing:
-            # Reset counters when not playing
-            if self._consecutive_triggers > 0 or self._consecutive_silence > 0:
-                self._consecutive_triggers = 0
-                self._consecutive_silence = 0
-                # Only restore if actually ducked
-                if self._audio_player is not None and self._audio_player.is_volume_ducked:
-                    self._audio_player.restore_volume()
+        if is_playing:
+            if self._audio_player is not None:
+                if is_speech:
+                    # While ducked, any trigger re-arms the full restore countdown
+                    if self._ducked:
+                        self._duck_score = self.DUCK_TRIGGER_COUNT
+                    else:
+                        prev_score = self._duck_score
+                        self._duck_score = min(max(prev_score, 0) + 1, self.DUCK_TRIGGER_COUNT)
+                        # Duck volume after sustained triggers - only on reaching the cap,
+                        # so a failed duck isn't retried (blocking subprocess) every chunk
+                        if prev_score < self.DUCK_TRIGGER_COUNT <= self._duck_score:
+                            self._audio_player.duck_volume(duck_percent=25)
+                            self._ducked = self._audio_player.is_volume_ducked
+                else:
+                    # Decay; reaching the floor from the cap = RESTORE_SILENCE_COUNT silent chunks.
+                    # Restore only on reaching the floor, so a failed restore isn't retried every chunk
+                    prev_score = self._duck_score
+                    self._duck_score = max(prev_score - 1, self._restore_score)
+                    if self._ducked and prev_score > self._restore_score == self._duck_score:
+                        self._audio_player.restore_volume()
+                        self._ducked = self._audio_player.is_volume_ducked
+        elif self._duck_score or self._ducked:
+            # Reset when not playing, restoring only if actually ducked. One
+            # attempt: the flag is cleared even if the restore failed
+            self._duck_score = 0
+            if self._ducked:
+                self._audio_player.restore_volume()
+                self._ducked = False
         
         # Log audio metrics during playback - only on significant events to reduce spam
         # Uses hysteresis: must go above 0.5 to "arm", then logs when dropping below 0.3
@@ -208,20 +318,22 @@ class InputPipeline:
                 should_log = True
                 self._vad_log_armed = False
             
-            if should_log:
-                aec_status = "AEC" if aec_applied else "NO-AEC"
-                status = "🔴 TRIGGERED" if is_speech else "⚪ filtered"
-                print(f"[{aec_status}] {status} VAD={speech_prob:.2f} (thr={threshold:.2f}) dB={db:.1f}")
+            if should_log and logger.isEnabledFor(logging.INFO) and self._take_log_budget():
+                logger.info(
+                    "[%s] %s VAD=%.2f (thr=%.2f) dB=%.1f",
+                    "AEC" if aec_applied else "NO-AEC",
+                    "🔴 TRIGGERED" if is_speech else "⚪ filtered",
+                    speech_prob,
+                    threshold,
+                    self._compute_db(resampled),
+                )
         
         # Process through state machine
         result = self._detector.process(resampled, is_speech, speech_prob)
         
         # Send based on event
-        if result.event == SpeechEvent.STARTED:
-            for chunk in result.chunks_to_send:
-                await self._connection.send_audio_chunk(websocket, chunk)
-        elif result.event == SpeechEvent.CONTINUING:
-            for chunk in result.chunks_to_send:
-                await self._connection.send_audio_chunk(websocket, chunk)
+        # Coalesce all chunks from this step (pre-buffer on STARTED) into one message
+        if result.event in (SpeechEvent.STARTED, SpeechEvent.CONTINUING):
+            await self._connection.send_audio_chunks(websocket, result.chunks_to_send)
         elif result.event == SpeechEvent.ENDED:
             await self._connection.send_end_speech(websocket)
@@ -6,19 +6,27 @@ Much faster than Chatterbox (~20-50x realtime) but lower quality.
 
 Endpoints:
   GET  /health     - Health check (returns model status)
-  POST /tts        - Generate speech from text (returns WAV audio)
+  POST /tts        - Generate speech from text (returns WAV audio, ?stream=true to stream)
 """
 
+import asyncio
 import io
+import json
 import logging
 import os
+import queue
+import select
+import shutil
+import struct
 import subprocess
 import tempfile
+import threading
 import time
-import wave
+import urllib.request
+import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
@@ -49,6 +57,41 @@ class Config:
     
     # Audio settings  
     SAMPLE_RATE: int = 22050  # Piper default
+    
+    # Max concurrent piper processes (extra requests queue instead of thrashing CPU)
+    MAX_CONCURRENT: int = int(os.getenv("PIPER_MAX_CONCURRENT", str(max(1, (os.cpu_count() or 2) // 2))))
+    
+    # Keep MAX_CONCURRENT piper processes running in --json-input mode instead
+    # of spawning (and re-loading the ONNX model) per request
+    PERSISTENT_WORKERS: bool = os.getenv("PIPER_PERSISTENT_WORKERS", "true").lower() == "true"
+    # Where persistent workers write their WAVs (tmpfs when available)
+    WORKER_OUTPUT_DIR: Path = Path(
+        os.getenv("PIPER_OUTPUT_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
+    )
+    # Pin each worker to its own slice of CPUs so N ONNX Runtime thread pools
+    # don't oversubscribe the same cores (needs taskset)
+    PIN_WORKERS: bool = os.getenv("PIPER_PIN_WORKERS", "true").lower() == "true"
+    # Seconds to wait for a worker to finish one utterance
+    WORKER_TIMEOUT_S: float = float(os.getenv("PIPER_WORKER_TIMEOUT_S", "30"))
+    
+    # Streaming: bytes of PCM read from Piper's stdout per response chunk
+    STREAM_CHUNK_BYTES: int = int(os.getenv("PIPER_STREAM_CHUNK_BYTES", "8192"))
+
+
+def _wav_header(sample_rate: int, data_len: int = 0xFFFFFFFF) -> bytes:
+    """
+    Build a 44-byte RIFF/WAVE header for 16-bit mono PCM.
+    
+    The default data_len of 0xFFFFFFFF is the streaming convention for
+    "unknown length" - readers treat the data chunk as running to EOF.
+    """
+    riff_len = 0xFFFFFFFF if data_len == 0xFFFFFFFF else 36 + data_len
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_len, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_len,
+    )
 
 
 # ============================================================================
@@ -58,9 +101,13 @@ class Config:
 class PiperTTS:
     """
     Wrapper for Piper TTS command-line tool.
+    
+    generate() is thread-safe: each call checks out its own worker process
+    (or spawns a one-shot process) and writes to a unique output file.
     """
     
     _instance: Optional["PiperTTS"] = None
+    _instance_lock = threading.Lock()
     
     def __init__(self):
         self.model_path: Optional[Path] = None
@@ -68,18 +115,23 @@ class PiperTTS:
         self.is_ready = False
         self.last_error: Optional[str] = None
         self.sample_rate = Config.SAMPLE_RATE
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._workers: Optional[queue.Queue] = None  # Idle persistent piper processes
     
     @classmethod
     def get_instance(cls) -> "PiperTTS":
         if cls._instance is None:
-            cls._instance = PiperTTS()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = PiperTTS()
         return cls._instance
     
-    def initialize(self) -> bool:
-        """Initialize Piper and verify model exists."""
+    async def initialize(self) -> bool:
+        """Initialize Piper and verify model exists (blocking steps run in threads)."""
         try:
             # Check if piper is installed
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["piper", "--help"],
                 capture_output=True,
                 text=True,
@@ -91,6 +143,10 @@ class PiperTTS:
             
             logger.info("Piper TTS binary found")
             
+            # Limit concurrent generations to roughly the physical core count
+            self._sem = asyncio.Semaphore(Config.MAX_CONCURRENT)
+            logger.info(f"Max concurrent generations: {Config.MAX_CONCURRENT}")
+            
             # Find model files
             model_name = Config.MODEL_NAME
             models_dir = Config.MODELS_DIR
@@ -102,7 +158,7 @@ class PiperTTS:
             if not self.model_path.exists():
                 # Try to download model
                 logger.info(f"Model not found at {self.model_path}, attempting download...")
-                if not self._download_model(model_name):
+                if not await self._download_model(model_name):
                     return False
             
             if not self.model_path.exists() or not self.config_path.exists():
@@ -114,7 +170,6 @@ class PiperTTS:
             
             # Get sample rate from config
             try:
-                import json
                 with open(self.config_path) as f:
                     config = json.load(f)
                     self.sample_rate = config.get("audio", {}).get("sample_rate", 22050)
@@ -122,8 +177,16 @@ class PiperTTS:
             except Exception as e:
                 logger.warning(f"Could not read config, using default sample rate: {e}")
             
+            # Start long-lived piper processes (model loaded once per process)
+            if Config.PERSISTENT_WORKERS:
+                try:
+                    await asyncio.to_thread(self._start_workers)
+                except Exception as e:
+                    self.shutdown()
+                    logger.warning(f"Persistent workers failed to start, using one process per request: {e}")
+            
             # Run warmup
-            self._warmup()
+            await asyncio.to_thread(self._warmup)
             
             self.is_ready = True
             self.last_error = None
@@ -134,12 +197,11 @@ class PiperTTS:
             logger.error(f"Failed to initialize Piper: {e}")
             return False
     
-    def _download_model(self, model_name: str) -> bool:
-        """Download model from Hugging Face."""
+    async def _download_model(self, model_name: str) -> bool:
+        """Download model and config from Hugging Face in parallel."""
         try:
             Config.MODELS_DIR.mkdir(parents=True, exist_ok=True)
             
-            # Use piper's built-in download (if available) or wget
             base_url = f"https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/lessac/medium"
             
             model_url = f"{base_url}/en_US-lessac-medium.onnx"
@@ -147,15 +209,11 @@ class PiperTTS:
             
             logger.info(f"Downloading model from {model_url}...")
             
-            # Download model
-            subprocess.run([
-                "wget", "-q", "-O", str(self.model_path), model_url
-            ], check=True, timeout=300)
-            
-            # Download config
-            subprocess.run([
-                "wget", "-q", "-O", str(self.config_path), config_url
-            ], check=True, timeout=60)
+            # Download model and config concurrently
+            await asyncio.gather(
+                asyncio.to_thread(self._download_file, model_url, self.model_path, 300),
+                asyncio.to_thread(self._download_file, config_url, self.config_path, 60),
+            )
             
             logger.info("Model downloaded successfully")
             return True
@@ -165,6 +223,17 @@ class PiperTTS:
             self.last_error = f"Model download failed: {e}"
             return False
     
+    @staticmethod
+    def _download_file(url: str, dest: Path, timeout: float) -> None:
+        """Stream a URL to dest via a .part file, renamed into place on success."""
+        part_path = dest.with_name(dest.name + ".part")
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response, open(part_path, "wb") as f:
+                shutil.copyfileobj(response, f, length=1024 * 1024)
+            part_path.replace(dest)
+        finally:
+            part_path.unlink(missing_ok=True)
+    
     def _warmup(self):
         """Run warmup inference."""
         logger.info("Running warmup inference...")
@@ -186,26 +255,178 @@ class PiperTTS:
         if not self.is_ready:
             raise RuntimeError("Piper not initialized")
         
+        if self._workers is not None:
+            return self._generate_via_worker(text)
+        
+        # Back Piper's --output_file with an anonymous in-memory file so no
+        # temp file is created/unlinked per request (Linux only)
+        if not hasattr(os, "memfd_create"):
+            return self._generate_via_tempfile(text)
+        
+        fd = os.memfd_create("piper_out", 0)
+        try:
+            self._run_piper(text, f"/proc/self/fd/{fd}", pass_fds=(fd,))
+            
+            # Read output
+            size = os.fstat(fd).st_size
+            return os.pread(fd, size, 0)
+            
+        finally:
+            os.close(fd)
+    
+    def _spawn_worker(self, cpus: Optional[str] = None) -> subprocess.Popen:
+        """
+        Start a piper process that synthesizes one JSON line per utterance.
+        
+        Args:
+            cpus: Optional taskset CPU list (e.g. "0,1") to pin the worker to
+        """
+        pin = ["taskset", "-c", cpus] if cpus else []
+        return subprocess.Popen(
+            pin + [
+                "piper",
+                "--model", str(self.model_path),
+                "--config", str(self.config_path),
+                "--json-input",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Piper logs per utterance - discard rather than let an unread pipe fill up
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    
+    def _start_workers(self):
+        """Spawn the persistent worker pool, one CPU slice per worker."""
+        Config.WORKER_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        
+        cpu_slices = self._worker_cpu_slices(Config.MAX_CONCURRENT)
+        self._workers = queue.Queue()
+        for cpus in cpu_slices:
+            self._workers.put((self._spawn_worker(cpus), cpus))
+        
+        pinned = f", pinned to CPUs {cpu_slices}" if cpu_slices[0] else ""
+        logger.info(f"Started {Config.MAX_CONCURRENT} persistent piper worker(s){pinned}")
+    
+    @staticmethod
+    def _worker_cpu_slices(n_workers: int) -> list:
+        """Split the CPUs we may run on into n_workers taskset lists (None = unpinned)."""
+        if not Config.PIN_WORKERS or n_workers < 2 or shutil.which("taskset") is None:
+            return [None] * n_workers
+        
+        cpus = sorted(os.sched_getaffinity(0))
+        per_worker = len(cpus) // n_workers
+        if per_worker == 0:
+            return [None] * n_workers
+        
+        return [
+            ",".join(str(c) for c in cpus[i * per_worker:(i + 1) * per_worker])
+            for i in range(n_workers)
+        ]
+    
+    def _generate_via_worker(self, text: str) -> bytes:
+        """Synthesize on an idle persistent worker (blocks until one is free)."""
+        proc, cpus = self._workers.get()
+        out_path = Config.WORKER_OUTPUT_DIR / f"piper-{uuid.uuid4().hex}.wav"
+        
+        try:
+            proc.stdin.write(json.dumps({"text": text, "output_file": str(out_path)}) + "\n")
+            proc.stdin.flush()
+            
+            # Piper prints the output path once the WAV is written
+            ready, _, _ = select.select([proc.stdout], [], [], Config.WORKER_TIMEOUT_S)
+            if not ready or not proc.stdout.readline():
+                raise RuntimeError(f"Piper worker failed (exit code: {proc.poll()})")
+            
+            return out_path.read_bytes()
+            
+        except Exception:
+            # Replace the (possibly wedged) worker before handing it back
+            proc.kill()
+            proc = self._spawn_worker(cpus)
+            raise
+            
+        finally:
+            self._workers.put((proc, cpus))
+            out_path.unlink(missing_ok=True)
+    
+    def shutdown(self):
+        """Stop persistent workers."""
+        workers, self._workers = self._workers, None
+        if workers is None:
+            return
+        
+        while not workers.empty():
+            proc, _ = workers.get_nowait()
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except Exception:
+                proc.kill()
+    
+    async def generate_async(self, text: str) -> bytes:
+        """
+        Generate speech without blocking the event loop.
+        
+        Runs generate() in a worker thread, gated by the concurrency semaphore.
+        """
+        async with self._sem:
+            return await asyncio.to_thread(self.generate, text)
+    
+    async def generate_stream(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Generate speech from text, yielding raw PCM as Piper produces it.
+        
+        Yields: 16-bit mono PCM chunks at self.sample_rate (no WAV header)
+        """
+        if not self.is_ready:
+            raise RuntimeError("Piper not initialized")
+        
+        async with self._sem:
+            async for chunk in self._stream_piper(text):
+                yield chunk
+    
+    async def _stream_piper(self, text: str) -> AsyncIterator[bytes]:
+        """Run piper in raw output mode and yield its stdout."""
+        proc = await asyncio.create_subprocess_exec(
+            "piper",
+            "--model", str(self.model_path),
+            "--config", str(self.config_path),
+            "--output-raw",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        
+        try:
+            proc.stdin.write(text.encode("utf-8"))
+            await proc.stdin.drain()
+            proc.stdin.close()
+            
+            while True:
+                chunk = await proc.stdout.read(Config.STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+            
+            if await proc.wait() != 0:
+                stderr = await proc.stderr.read()
+                raise RuntimeError(f"Piper failed: {stderr.decode(errors='replace')}")
+        
+        finally:
+            # Client disconnected or error - don't leave piper running
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    
+    def _generate_via_tempfile(self, text: str) -> bytes:
+        """Fallback for platforms without memfd_create: round-trip through a temp file."""
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
             tmp_path = tmp.name
         
         try:
-            # Run piper
-            result = subprocess.run(
-                [
-                    "piper",
-                    "--model", str(self.model_path),
-                    "--config", str(self.config_path),
-                    "--output_file", tmp_path,
-                ],
-                input=text,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Piper failed: {result.stderr}")
+            self._run_piper(text, tmp_path)
             
             # Read output
             with open(tmp_path, "rb") as f:
@@ -219,6 +440,25 @@ class PiperTTS:
                 os.unlink(tmp_path)
             except:
                 pass
+    
+    def _run_piper(self, text: str, output_file: str, pass_fds: tuple = ()) -> None:
+        """Run the piper binary once, writing a WAV to output_file."""
+        result = subprocess.run(
+            [
+                "piper",
+                "--model", str(self.model_path),
+                "--config", str(self.config_path),
+                "--output_file", output_file,
+            ],
+            input=text,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            pass_fds=pass_fds,
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Piper failed: {result.stderr}")
 
 
 # ============================================================================
@@ -235,11 +475,13 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
     
     piper = PiperTTS.get_instance()
-    if not piper.initialize():
+    if not await piper.initialize():
         logger.error("Piper failed to initialize - service will return 503 on /tts")
     
     yield
     
+    # Waits on each worker process to exit - keep it off the event loop
+    await asyncio.to_thread(piper.shutdown)
     logger.info("Piper TTS Service shutting down")
 
 
@@ -312,11 +554,12 @@ async def health_check():
 
 
 @app.post("/tts")
-async def text_to_speech(request: TTSRequest):
+async def text_to_speech(request: TTSRequest, stream: bool = False):
     """
     Generate speech from text.
     
-    Returns WAV audio.
+    Returns WAV audio. With ?stream=true the WAV header is sent immediately
+    (unknown-length sizes) and PCM is streamed as Piper produces it.
     """
     piper = PiperTTS.get_instance()
     
@@ -326,21 +569,19 @@ async def text_to_speech(request: TTSRequest):
             detail="Piper TTS not initialized. Check /health for details.",
         )
     
+    if stream:
+        return _stream_tts(piper, request.text)
+    
     try:
         start = time.perf_counter()
         
         # Generate audio
-        wav_data = piper.generate(request.text)
+        wav_data = await piper.generate_async(request.text)
         
         generation_ms = (time.perf_counter() - start) * 1000
         
-        # Calculate duration from WAV
-        wav_buffer = io.BytesIO(wav_data)
-        with wave.open(wav_buffer, 'rb') as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-            audio_duration_s = frames / rate
-        wav_buffer.seek(0)
+        # Duration from payload size: Piper writes a 44-byte header + 16-bit mono PCM
+        audio_duration_s = max(0, len(wav_data) - 44) / (2 * piper.sample_rate)
         
         rtf = generation_ms / (audio_duration_s * 1000) if audio_duration_s > 0 else 0
         
@@ -364,6 +605,37 @@ async def text_to_speech(request: TTSRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _stream_tts(piper: PiperTTS, text: str) -> StreamingResponse:
+    """Build a streaming WAV response that overlaps synthesis with transfer."""
+    
+    async def body() -> AsyncIterator[bytes]:
+        start = time.perf_counter()
+        first_chunk_ms = None
+        pcm_bytes = 0
+        
+        yield _wav_header(piper.sample_rate)
+        
+        try:
+            async for chunk in piper.generate_stream(text):
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - start) * 1000
+                pcm_bytes += len(chunk)
+                yield chunk
+        except Exception as e:
+            # Headers are already sent - all we can do is log and end the body
+            logger.error(f"TTS streaming failed: {e}")
+            return
+        
+        generation_ms = (time.perf_counter() - start) * 1000
+        audio_duration_s = pcm_bytes / (2 * piper.sample_rate)
+        logger.info(
+            f"TTS [cpu/onnx/stream]: {len(text)} chars -> {audio_duration_s:.2f}s audio | "
+            f"first={first_chunk_ms or 0:.0f}ms, gen={generation_ms:.0f}ms"
+        )
+    
+    return StreamingResponse(body(), media_type="audio/wav")
+
+
 @app.get("/")
 async def root():
     """Root endpoint - service info."""
@@ -372,7 +644,7 @@ async def root():
         "model": Config.MODEL_NAME,
         "endpoints": {
             "/health": "GET - Health check",
-            "/tts": "POST - Text-to-speech synthesis",
+            "/tts": "POST - Text-to-speech synthesis (?stream=true for chunked PCM)",
         },
     }
 
@@ -42,4 +42,12 @@ if __name__ == "__main__":
     import uvicorn
     from server import app
     
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=5000,
+        loop="uvloop",
+        http="httptools",
+        workers=1,
+        access_log=False,
+    )
@@ -6,26 +6,57 @@ Designed to run as a Docker container with NVIDIA GPU access.
 
 Endpoints:
   GET  /health          - Health check (returns model status)
-  POST /tts             - Generate speech from text (returns WAV audio)
+  POST /tts             - Generate speech from text (returns WAV audio, ?stream=true for chunked PCM)
   GET  /voice/{voice_id} - Check if voice is cached
   POST /voice/{voice_id} - Upload voice audio for caching
 """
 
 import asyncio
+import copy
+import functools
 import hashlib
 import io
 import logging
 import os
 import random
+import re
+import struct
+import tempfile
+import threading
 import time
-from contextlib import asynccontextmanager
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
 
+# ============================================================================
+# Compile Cache (must be set before torch is imported)
+# ============================================================================
+# Persist TorchInductor/Triton kernels so restarts load compiled artifacts from
+# disk instead of re-tracing. Mounted as a Docker volume for persistence.
+# Inductor keys entries by GPU and torch version, so one volume can be
+# shared across machines/images without mixing kernels.
+TORCH_CACHE_DIR = Path(os.getenv("TTS_TORCH_CACHE_DIR", "/tmp/edda-torch-cache"))
+os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(TORCH_CACHE_DIR / "inductor"))
+os.environ.setdefault("TRITON_CACHE_DIR", str(TORCH_CACHE_DIR / "triton"))
+# The NVIDIA driver's JIT cache (PTX -> SASS for Triton kernels) defaults to
+# ~/.nv inside the container and is small; keep it with the other caches
+os.environ.setdefault("CUDA_CACHE_PATH", str(TORCH_CACHE_DIR / "nv"))
+os.environ.setdefault("CUDA_CACHE_MAXSIZE", str(1024**3))
+
+# CUDA caching allocator (also read once, at first CUDA use): expandable
+# segments grow in place instead of carving fixed blocks, so utterances of
+# varying length don't fragment VRAM into reserved-but-unusable splits
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "expandable_segments:True,max_split_size_mb:128,garbage_collection_threshold:0.8",
+)
+
+import orjson
 import torch
-import torchaudio
-from fastapi import FastAPI, HTTPException, Response, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, Response, UploadFile, File
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 # ============================================================================
@@ -37,6 +68,8 @@ if torch.cuda.is_available():
     # Allow TF32 on Ampere+ GPUs (ignored on older GPUs like 2070)
     torch.backends.cuda.matmul.allow_tf32 = True
     torch.backends.cudnn.allow_tf32 = True
+    # PyTorch 2.x switch that lets inductor pick TF32 tensor-core matmul kernels
+    torch.set_float32_matmul_precision("high")
 
 # Configure logging
 logging.basicConfig(
@@ -46,6 +79,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# torch.compile settings (must be set before any torch.compile call).
+# Dynamo specializes on the float sampling params, so each param combination
+# (plus the dynamic-shape recompile per code object) is its own cache entry;
+# the default limit of 8-64 (version dependent) silently falls back to eager
+# once exceeded, so allow plenty of room.
+try:
+    import torch._dynamo
+    import torch._inductor.config
+
+    torch._dynamo.config.cache_size_limit = int(os.getenv("TTS_DYNAMO_CACHE_LIMIT", "256"))
+    # Trace scalar reads like `.item()` (e.g. EOS checks) into the graph
+    # instead of breaking it, so fullgraph=True can hold
+    torch._dynamo.config.capture_scalar_outputs = True
+    torch._inductor.config.triton.cudagraphs = True
+
+    # TTS_LOG_GRAPH_BREAKS=true logs every graph break with its source location
+    if os.getenv("TTS_LOG_GRAPH_BREAKS", "false").lower() == "true":
+        torch._logging.set_logs(graph_breaks=True)
+except (ImportError, AttributeError) as e:
+    logger.warning(f"Could not configure torch.compile: {e}")
+
 
 # ============================================================================
 # Configuration
@@ -61,6 +115,20 @@ class Config:
     # Voice cache directory (persistent storage for uploaded voices)
     VOICE_CACHE_DIR: Path = Path(os.getenv("TTS_VOICE_CACHE_DIR", "/tmp/edda-voice-cache"))
 
+    # How often the in-memory voice index is resynced with the directory
+    # (self-heals if files are added/removed outside the service)
+    VOICE_CACHE_RESYNC_S: int = int(os.getenv("TTS_VOICE_CACHE_RESYNC_S", "60"))
+
+    # In-memory LRU of encoded /tts responses keyed on (text, voice, params),
+    # so repeated lines skip inference entirely (0 = disabled)
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("TTS_RESPONSE_CACHE_SIZE", "128"))
+    # ...and its memory budget (one 5000-char response is ~16 MB of WAV)
+    RESPONSE_CACHE_MB: int = int(os.getenv("TTS_RESPONSE_CACHE_MB", "256"))
+
+    # Hash uploads to check the client's voice_id (mismatches are only logged,
+    # so trusted deployments can skip the hashing)
+    VERIFY_UPLOAD_HASH: bool = os.getenv("TTS_VERIFY_HASH", "true").lower() == "true"
+
     # Performance options
     # torch.compile gives ~20-40% speedup after warmup (requires PyTorch 2.0+)
     # Enable by default on CUDA, disable on CPU (compile doesn't help much there)
@@ -69,15 +137,106 @@ class Config:
         "true" if torch.cuda.is_available() else "false"
     ).lower() == "true"
 
+    # Compile with fullgraph=True so CUDA graphs capture the whole hot path.
+    # If the model has graph breaks, load() falls back to fullgraph=False.
+    COMPILE_FULLGRAPH: bool = os.getenv("TTS_COMPILE_FULLGRAPH", "true").lower() == "true"
+
+    # torch.compile mode. "reduce-overhead" = CUDA graphs. "max-autotune" also
+    # benchmarks Triton GEMM/conv templates on every (re)compile - opt-in, since
+    # any recompile triggered by a live request pays that autotuning too
+    COMPILE_MODE: str = os.getenv("TTS_COMPILE_MODE", "reduce-overhead")
+
+    # Portable bundle of compiled kernels + autotune results saved after the
+    # first compile and preloaded on later starts. Point it inside the image to
+    # ship it pre-built (same GPU arch and torch version); empty = disabled
+    _compile_artifacts: str = os.getenv("TTS_COMPILE_ARTIFACTS", str(TORCH_CACHE_DIR / "compile-artifacts.bin"))
+    COMPILE_ARTIFACTS_PATH: Optional[Path] = Path(_compile_artifacts) if _compile_artifacts else None
+
+    # Autocast dtype for CUDA inference: "bfloat16", "fp16", "fp32", or "auto"
+    # (auto = bfloat16 on GPUs with native bf16 support, fp32 otherwise)
+    INFERENCE_DTYPE: str = os.getenv("TTS_DTYPE", "auto").lower()
+
+    # Also store t2s/s2a weights in the autocast dtype, so autocast doesn't
+    # re-cast FP32 weights on every call (ve stays FP32 - it is small and
+    # its normalization is precision sensitive)
+    CAST_WEIGHTS: bool = os.getenv("TTS_CAST_WEIGHTS", "true").lower() == "true"
+
+    # Ask Hugging Face backbones inside the model to use a preallocated static
+    # KV cache (fixed tensor addresses, CUDA-graph friendly). Only affects
+    # submodules that decode through HF generate(); off by default
+    STATIC_KV_CACHE: bool = os.getenv("TTS_STATIC_KV_CACHE", "false").lower() == "true"
+
+    # Store s2a's 2D conv weights channels-last (NHWC) so cuDNN can pick
+    # tensor-core kernels. Conv1d layers (the vocoder) have no channels-last
+    # layout and are left as they are; off by default
+    CHANNELS_LAST: bool = os.getenv("TTS_CHANNELS_LAST", "false").lower() == "true"
+
     # Number of warmup iterations (more = better perf but slower startup)
-    WARMUP_ITERATIONS: int = int(os.getenv("TTS_WARMUP_ITERATIONS", "3"))
+    WARMUP_ITERATIONS: int = int(os.getenv("TTS_WARMUP_ITERATIONS", "5"))
+
+    # Voice conditionals (speaker embedding + prompt tokens) kept per
+    # reference file, so repeat voices skip loading, resampling and the voice
+    # encoder on every request (0 = disabled)
+    VOICE_CONDS_CACHE_SIZE: int = int(os.getenv("TTS_VOICE_CONDS_CACHE", "32"))
+
+    # Cached-but-unused VRAM (reserved - allocated) above which the allocator
+    # cache is released after a request. Too low costs re-allocations on the
+    # next request; 0 = never release
+    CUDA_RELEASE_THRESHOLD_MB: int = int(os.getenv("TTS_CUDA_RELEASE_MB", "2048"))
 
     # Audio settings
     SAMPLE_RATE: int = 24000  # Chatterbox native sample rate
 
+    # Longest utterance that fits the pinned GPU->CPU staging buffer
+    # (longer audio falls back to a regular synchronous copy)
+    MAX_AUDIO_SECONDS: int = int(os.getenv("TTS_MAX_AUDIO_SECONDS", "300"))
+
+    # ?stream=true time-to-first-audio knobs for models that can't stream
+    # natively: PCM slice size, and the segment size (in tokens) the text is
+    # split into, so the first sentences are sent while the rest generates
+    STREAM_CHUNK_SAMPLES: int = SAMPLE_RATE * int(os.getenv("TTS_STREAM_CHUNK_MS", "200")) // 1000
+    STREAM_SEGMENT_TOKENS: int = int(os.getenv("TTS_STREAM_SEGMENT_TOKENS", "64"))
+
     # Model warmup
     WARMUP_TEXT: str = "Hello, this is a warmup test."
 
+    # Token lengths warmed once each after compiling. Inputs can't be padded to
+    # these sizes, so they don't map requests onto fixed graphs; seeing several
+    # lengths makes dynamo mark the length dims dynamic during warmup (instead
+    # of on a live request) and records CUDA graphs for typical sizes
+    WARMUP_TOKEN_BUCKETS: tuple = tuple(
+        int(b) for b in os.getenv("TTS_WARMUP_BUCKETS", "32,64,128,256,512").split(",") if b.strip()
+    )
+    WARMUP_FILLER: str = "The quick brown fox jumps over the lazy dog while the band plays on."
+
+    # Longest text (in tokens) sent to the model in one call. Longer requests are
+    # split on sentence boundaries and the audio concatenated, keeping live
+    # lengths within the range exercised at warmup and bounding per-call
+    # memory (0 = off)
+    MAX_TEXT_TOKENS: int = int(os.getenv(
+        "TTS_MAX_TEXT_TOKENS", str(max(WARMUP_TOKEN_BUCKETS, default=0))
+    ))
+
+    # Representative utterances and (exaggeration, cfg_weight) pairs warmed in
+    # every combination after compiling. Dynamo specializes on these floats,
+    # so the defaults match what the C# server sends (0.5 and 0.6 / 0.5).
+    WARMUP_CORPUS: tuple = (
+        "Hi.",
+        "Hello there, friend.",
+        "Sure, I can help with that. Give me a second to look it up.",
+        "Here is what I found. The forecast for tomorrow is mostly sunny with a high "
+        "of seventy two degrees, and there is a light breeze coming in from the west "
+        "in the afternoon, so it should be a nice day to be outside.",
+    )
+    WARMUP_PARAMS: tuple = tuple(
+        tuple(float(v) for v in pair.split(":"))
+        for pair in os.getenv("TTS_WARMUP_PARAMS", "0.5:0.5,0.6:0.5").split(",") if pair.strip()
+    )
+
+    # Requests allowed to wait for the GPU behind the one generating; beyond
+    # this /tts answers 503 instead of queueing unboundedly (0 = no limit)
+    MAX_QUEUED_REQUESTS: int = int(os.getenv("TTS_MAX_QUEUE", "8"))
+
     # Model loading retry settings
     LOAD_MAX_RETRIES: int = int(os.getenv("TTS_LOAD_MAX_RETRIES", "10"))
     LOAD_INITIAL_DELAY_S: float = float(os.getenv("TTS_LOAD_INITIAL_DELAY_S", "5"))
@@ -88,6 +247,58 @@ class Config:
     BACKGROUND_RETRY_INTERVAL_S: int = int(os.getenv("TTS_BACKGROUND_RETRY_S", "60"))
 
 
+# ============================================================================
+# WAV Encoding
+# ============================================================================
+
+def _wav_header(sample_rate: int, data_len: int = 0xFFFFFFFF) -> bytes:
+    """
+    Build a 44-byte RIFF/WAVE header for 16-bit mono PCM.
+
+    The default data_len of 0xFFFFFFFF is the streaming convention for
+    "unknown length" - readers treat the data chunk as running to EOF.
+    """
+    riff_len = 0xFFFFFFFF if data_len == 0xFFFFFFFF else 36 + data_len
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_len, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_len,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _stream_wav_header(sample_rate: int) -> bytes:
+    """Unknown-length header for ?stream=true (the only header that repeats)."""
+    return _wav_header(sample_rate)
+
+
+def _pcm16(audio: torch.Tensor) -> torch.Tensor:
+    """Quantize float audio in [-1, 1] (any device/dtype) to a flat int16 tensor."""
+    # Scale in fp32 - bf16 can't represent the 16-bit sample grid
+    return audio.reshape(-1).float().clamp(-1.0, 1.0).mul_(32767).to(torch.int16)
+
+
+def _write_wav_pcm16(buf: io.BytesIO, pcm: torch.Tensor, sample_rate: int):
+    """Write a flat int16 CPU tensor as a complete 16-bit mono PCM WAV file."""
+    samples = pcm.numpy()
+    buf.write(_wav_header(sample_rate, samples.nbytes))
+    buf.write(samples.data)  # Buffer protocol - no intermediate bytes copy
+
+
+def _identity(audio: torch.Tensor) -> torch.Tensor:
+    return audio
+
+
+def _unsqueeze0(audio: torch.Tensor) -> torch.Tensor:
+    return audio.unsqueeze(0)
+
+
+def _as_2d(audio: torch.Tensor) -> torch.Tensor:
+    """Fallback until the output rank is known: reshape to (1, samples)."""
+    return audio.reshape(1, -1)
+
+
 # ============================================================================
 # Voice Cache
 # ============================================================================
@@ -99,6 +310,12 @@ class VoiceCache:
     No expiration - voices persist forever (storage is cheap).
     """
 
+    CHUNK_SIZE = 64 * 1024  # Upload spool chunk size
+
+    # Voice IDs are SHA-256 prefixes - must match what the C# server computes
+    HASH_ALGO = "sha256"
+    HASH_LEN = 16
+
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -109,46 +326,275 @@ class VoiceCache:
         if existing:
             logger.info(f"Found {len(existing)} cached voice(s): {[f.stem for f in existing]}")
 
+        # Cached IDs indexed in memory so lookups and /health never touch the
+        # filesystem. Updated on store(), resynced periodically from disk.
+        self._ids = {f.stem for f in existing}
+        # resync() and store() both run on executor threads; the lock keeps a
+        # resync snapshot from dropping a voice stored while it was taken
+        self._ids_lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of cached voices."""
+        return len(self._ids)
+
+    def resync(self):
+        """Rebuild the in-memory index from disk (picks up external changes)."""
+        with self._ids_lock:
+            ids = {f.stem for f in self.cache_dir.glob("*.wav")}
+            if ids != self._ids:
+                logger.info(f"Voice cache resynced: {len(self._ids)} -> {len(ids)} voice(s)")
+            self._ids = ids
+
+    @staticmethod
+    def _safe_id(voice_id: str) -> str:
+        """Sanitize voice_id to prevent path traversal."""
+        return "".join(c for c in voice_id if c.isalnum() or c in "-_")
+
     def get_path(self, voice_id: str) -> Path:
         """Get the cache path for a voice ID (doesn't check existence)."""
-        # Sanitize voice_id to prevent path traversal
-        safe_id = "".join(c for c in voice_id if c.isalnum() or c in "-_")
-        return self.cache_dir / f"{safe_id}.wav"
+        return self.cache_dir / f"{self._safe_id(voice_id)}.wav"
 
     def exists(self, voice_id: str) -> bool:
         """Check if a voice is cached."""
-        return self.get_path(voice_id).exists()
+        return self._safe_id(voice_id) in self._ids
 
     def get(self, voice_id: str) -> Optional[Path]:
         """Get path to cached voice, or None if not cached."""
-        path = self.get_path(voice_id)
-        return path if path.exists() else None
+        return self.get_path(voice_id) if self.exists(voice_id) else None
 
-    def store(self, voice_id: str, audio_data: bytes) -> Path:
+    def store(
+        self,
+        voice_id: str,
+        source: BinaryIO,
+        prefix: bytes = b"",
+        compute_hash: bool = True,
+    ) -> tuple:
         """
-        Store voice audio in cache.
+        Stream voice audio into the cache.
+
+        The data is spooled to a temp file in chunks (hashed on the way through
+        when compute_hash is set), then renamed into place, so a partial upload
+        never shows up as cached.
 
         Args:
             voice_id: Identifier for this voice (typically a content hash)
-            audio_data: Raw WAV audio bytes
+            source: File object positioned after `prefix`
+            prefix: Bytes already read from source (e.g. the validated header)
+            compute_hash: Hash the content while spooling
 
         Returns:
-            Path to the cached file
+            (path to the cached file, size in bytes, computed hash or None)
         """
         path = self.get_path(voice_id)
-        path.write_bytes(audio_data)
-        logger.info(f"Cached voice '{voice_id}' ({len(audio_data)} bytes) -> {path}")
-        return path
+        hasher = self.new_hasher() if compute_hash else None
+        size = len(prefix)
 
-    @staticmethod
-    def compute_hash(audio_data: bytes) -> str:
+        # Unique temp name: concurrent uploads of the same voice (e.g. from
+        # several EDDA servers) each spool to their own file, last rename wins
+        out = tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.stem}.", suffix=".part", delete=False
+        )
+        tmp_path = Path(out.name)
+
+        try:
+            with out:
+                out.write(prefix)
+                if hasher is not None:
+                    hasher.update(prefix)
+                while chunk := source.read(self.CHUNK_SIZE):
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        with self._ids_lock:
+            self._ids.add(path.stem)
+        logger.info(f"Cached voice '{voice_id}' ({size} bytes) -> {path}")
+        computed = hasher.hexdigest()[:self.HASH_LEN] if hasher is not None else None
+        return path, size, computed
+
+    @classmethod
+    def new_hasher(cls):
+        """
+        Create an incremental hasher for voice content.
+
+        usedforsecurity=False only marks this as a non-security use, so
+        FIPS-restricted builds don't gate it; hashing speed is unchanged. The
+        algorithm stays SHA-256 (not a faster hash) because voice IDs must
+        match the ones the C# server derives.
+        """
+        return hashlib.new(cls.HASH_ALGO, usedforsecurity=False)
+
+    @classmethod
+    def compute_hash(cls, audio_data: bytes) -> str:
         """Compute a short content hash for audio data."""
-        return hashlib.sha256(audio_data).hexdigest()[:16]
+        hasher = cls.new_hasher()
+        hasher.update(audio_data)
+        return hasher.hexdigest()[:cls.HASH_LEN]
 
 
 # Global voice cache instance
 voice_cache: Optional[VoiceCache] = None
 
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+class ResponseCache:
+    """
+    Small in-memory LRU of encoded WAV responses.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def key(request: "TTSRequest", voice_path: Optional[str]) -> Optional[bytes]:
+        """
+        Cache key for a request with its resolved voice, or None if uncacheable.
+
+        Includes the voice file's mtime, so re-uploaded or edited voices
+        don't serve stale audio.
+        """
+        voice_mtime = 0
+        if voice_path:
+            try:
+                voice_mtime = os.stat(voice_path).st_mtime_ns
+            except OSError:
+                return None
+        raw = (
+            f"{request.text}|{voice_path or ''}|{voice_mtime}|"
+            f"{request.exaggeration:.3f}|{request.cfg_weight:.3f}"
+        )
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[tuple]:
+        """Return (wav_bytes, audio_duration_s) and mark as recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: bytes, wav_bytes: bytes, audio_duration_s: float):
+        """Store a response, evicting the least recently used past max_entries/max_bytes."""
+        if self.max_entries <= 0 or len(wav_bytes) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[0])
+        self._entries[key] = (wav_bytes, audio_duration_s)
+        self._bytes += len(wav_bytes)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)[1]
+            self._bytes -= len(evicted)
+
+
+response_cache = ResponseCache(Config.RESPONSE_CACHE_SIZE, Config.RESPONSE_CACHE_MB * 1024**2)
+
+
+# ============================================================================
+# GPU Gate
+# ============================================================================
+
+class GpuGate:
+    """
+    One request on the GPU at a time, with a bounded FIFO wait line.
+
+    tts_executor already runs one job at a time, but a streaming request
+    submits one job per chunk, so without the gate two requests interleave
+    their generate calls (and CUDA graph replays) chunk by chunk. Holding the
+    gate for the whole request keeps requests strictly one after another.
+    Only touched from the event loop thread.
+    """
+
+    def __init__(self, max_waiting: int):
+        self.max_waiting = max_waiting
+        self._slot = asyncio.Semaphore(1)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of admitted requests that don't hold the GPU yet."""
+        return self._waiting
+
+    def reserve(self) -> "GpuReservation":
+        """
+        Admit a request to the wait line, or raise 503 if it is full.
+
+        The place counts from admission (not from turn()), so requests still
+        tokenizing or whose stream body hasn't started are within the bound.
+        Every reservation must end in turn() or release().
+        """
+        if self.max_waiting and self._waiting >= self.max_waiting:
+            raise HTTPException(
+                status_code=503,
+                detail=f"TTS busy ({self._waiting} requests queued), retry later",
+            )
+        self._waiting += 1
+        return GpuReservation(self)
+
+    @asynccontextmanager
+    async def turn(self, reservation: "GpuReservation"):
+        """Wait for, then hold, the GPU for the duration of the block."""
+        try:
+            await self._slot.acquire()
+        finally:
+            reservation.release()
+        try:
+            yield
+        finally:
+            self._slot.release()
+
+
+class GpuReservation:
+    """A place in the GpuGate wait line; release() is idempotent."""
+
+    __slots__ = ("_gate",)
+
+    def __init__(self, gate: GpuGate):
+        self._gate: Optional[GpuGate] = gate
+
+    def release(self):
+        """Give up the place in line (no-op once released or turned)."""
+        if self._gate is not None:
+            self._gate._waiting -= 1
+            self._gate = None
+
+
+# Dedicated executor for blocking inference/encode work. A single worker keeps
+# GPU requests one-at-a-time while the event loop stays free for /health etc.
+tts_executor: Optional[ThreadPoolExecutor] = None
+gpu_gate: Optional[GpuGate] = None
+
+# Single thread for text splitting (token counting), so the private tokenizer
+# copy is only ever used from one thread while tts_executor generates
+text_executor: Optional[ThreadPoolExecutor] = None
+
+_tts_thread = threading.local()
+
+
+def _init_tts_thread():
+    """
+    tts_executor initializer: enter inference mode once for the worker's lifetime.
+
+    Inference mode is thread-local, and all model work (load, compile, warmup,
+    generate, encode) runs on this one thread, so TTSModel doesn't need to
+    enter and exit it on every call.
+    """
+    _tts_thread.inference_mode = torch.inference_mode()
+    _tts_thread.inference_mode.__enter__()
+
 
 # ============================================================================
 # Model Singleton
@@ -169,6 +615,17 @@ class TTSModel:
         self.load_time_ms: float = 0
         self.last_error: Optional[str] = None
         self._loading = False  # Prevent concurrent load attempts
+        self._stop_loading = threading.Event()  # Set on shutdown to abandon load retries
+        self._cpu_pinned: Optional[torch.Tensor] = None  # GPU->CPU staging buffer
+        self._copy_done = None  # CUDA event recorded after each staging copy
+        self.autocast_dtype: Optional[torch.dtype] = None  # None = full precision
+        # Output shape fixer, picked once from the first warmup output so
+        # generate() always returns (1, samples) without a per-call branch
+        self._to_2d = _as_2d
+        self._encode = None  # encode() of a private tokenizer copy, if the model exposes one
+        self.device_map: dict = {}  # Component name -> device, filled by _verify_device()
+        self._default_conds = None  # Built-in voice conditionals, restored for default-voice requests
+        self._conds_cache: OrderedDict = OrderedDict()  # (path, mtime_ns) -> conditionals
         self._background_retry_task: Optional[asyncio.Task] = None
 
     @classmethod
@@ -199,24 +656,62 @@ class TTSModel:
             # Verify model is actually on the expected device
             self._verify_device()
 
-            # Optional: torch.compile for faster inference (experimental)
-            if Config.USE_TORCH_COMPILE:
-                logger.info("Compiling model with torch.compile() - this may take a minute...")
-                try:
-                    # Compile the internal models if accessible
-                    # Note: This is experimental and may not work with all model architectures
-                    compile_start = time.perf_counter()
-                    if hasattr(self.model, 't2s') and self.model.t2s is not None:
-                        self.model.t2s = torch.compile(self.model.t2s, mode="reduce-overhead")
-                    if hasattr(self.model, 's2a') and self.model.s2a is not None:
-                        self.model.s2a = torch.compile(self.model.s2a, mode="reduce-overhead")
-                    compile_ms = (time.perf_counter() - compile_start) * 1000
-                    logger.info(f"Model compiled in {compile_ms:.0f}ms")
-                except Exception as e:
-                    logger.warning(f"torch.compile failed (non-fatal): {e}")
-
-            # Warmup inference (first inference is always slower)
-            self._warmup()
+            self._encode = self._private_encode()
+            self._default_conds = getattr(self.model, "conds", None)
+            self._conds_cache.clear()
+
+            # Pinned host buffer for fast non-blocking audio copies off the GPU
+            if self.device.startswith("cuda") and torch.cuda.is_available():
+                self._cpu_pinned = torch.empty(
+                    Config.MAX_AUDIO_SECONDS * self.sample_rate,
+                    dtype=torch.int16,
+                    pin_memory=True,
+                )
+                self._copy_done = torch.cuda.Event()
+
+            if Config.STATIC_KV_CACHE:
+                self._enable_static_kv_cache()
+
+            self.autocast_dtype = self._resolve_autocast_dtype()
+            logger.info(f"Inference precision: {self.autocast_dtype or 'fp32'}")
+            if self.autocast_dtype is not None and Config.CAST_WEIGHTS:
+                self._cast_weights(self.autocast_dtype)
+
+            if Config.CHANNELS_LAST and self.device.startswith("cuda"):
+                self._apply_channels_last()
+
+            compiled = False
+
+            # Compile and warm up under the same autocast context that
+            # generate() uses (and, on tts_executor, the same inference mode),
+            # so dynamo guards match the runtime context - a guard mismatch
+            # recompiles and can be far slower than eager
+            with self._autocast():
+                # Optional: torch.compile for faster inference (experimental).
+                # CUDA only - the CUDA-graph/autotune modes do nothing on CPU
+                if Config.USE_TORCH_COMPILE and not self.device.startswith("cuda"):
+                    logger.info(f"Skipping torch.compile on {self.device}")
+                elif Config.USE_TORCH_COMPILE:
+                    logger.info("Compiling model with torch.compile() - this may take a minute...")
+                    try:
+                        # Compile the internal models if accessible
+                        # Note: This is experimental and may not work with all model architectures
+                        compile_start = time.perf_counter()
+                        self._configure_inductor()
+                        self._load_compile_artifacts()
+                        self._compile(fullgraph=Config.COMPILE_FULLGRAPH)
+                        compiled = True
+                        compile_ms = (time.perf_counter() - compile_start) * 1000
+                        logger.info(f"Model compiled in {compile_ms:.0f}ms")
+                    except Exception as e:
+                        logger.warning(f"torch.compile failed (non-fatal): {e}")
+
+                # Warmup inference (first inference is always slower)
+                self._warmup()
+
+            # Warmup triggered the actual compilation - persist it for next start
+            if compiled:
+                self._save_compile_artifacts()
 
             self.is_ready = True
             self.last_error = None
@@ -242,6 +737,9 @@ class TTSModel:
         delay = Config.LOAD_INITIAL_DELAY_S
 
         for attempt in range(1, Config.LOAD_MAX_RETRIES + 1):
+            if self._stop_loading.is_set():
+                return False
+
             logger.info(f"Model load attempt {attempt}/{Config.LOAD_MAX_RETRIES}")
 
             if self.load():
@@ -257,7 +755,10 @@ class TTSModel:
                     f"Model load failed (attempt {attempt}/{Config.LOAD_MAX_RETRIES}). "
                     f"Retrying in {wait_time:.1f}s... Error: {self.last_error}"
                 )
-                time.sleep(wait_time)
+                # Interruptible wait, so shutdown doesn't block on the backoff
+                if self._stop_loading.wait(wait_time):
+                    logger.info("Model load retries abandoned (shutting down)")
+                    return False
                 delay = min(delay * Config.LOAD_BACKOFF_MULTIPLIER, Config.LOAD_MAX_DELAY_S)
 
         logger.error(
@@ -291,8 +792,8 @@ class TTSModel:
 
                 logger.info(f"Background model load attempt {attempt}...")
 
-                # Run blocking load in thread pool
-                success = await asyncio.get_running_loop().run_in_executor(None, self.load)
+                # Run blocking load on the inference thread
+                success = await asyncio.get_running_loop().run_in_executor(tts_executor, self.load)
 
                 if success:
                     logger.info(f"✓ Background model load succeeded on attempt {attempt}")
@@ -310,41 +811,212 @@ class TTSModel:
         )
 
     def stop_background_retry(self):
-        """Cancel the background retry task if running."""
+        """Cancel the background retry task and any load_with_retry() backoff."""
+        self._stop_loading.set()
         if self._background_retry_task is not None:
             self._background_retry_task.cancel()
             self._background_retry_task = None
             logger.info("Background retry task cancelled")
 
+    def _enable_static_kv_cache(self):
+        """Switch HF generation configs found on the model to a static KV cache."""
+        patched = []
+        for name, component in vars(self.model).items():
+            if not isinstance(component, torch.nn.Module):
+                continue
+            for module in component.modules():
+                gen_config = getattr(module, "generation_config", None)
+                if gen_config is not None and hasattr(gen_config, "cache_implementation"):
+                    gen_config.cache_implementation = "static"
+                    patched.append(f"{name}.{type(module).__name__}")
+
+        if patched:
+            logger.info(f"Static KV cache enabled on: {patched}")
+        else:
+            logger.warning("TTS_STATIC_KV_CACHE set, but no HF generation config found on the model")
+
+    def _apply_channels_last(self):
+        """Convert s2a to channels_last if it has 2D convs (before compiling)."""
+        s2a = getattr(self.model, "s2a", None)
+        if not isinstance(s2a, torch.nn.Module):
+            return
+
+        n_conv2d = sum(isinstance(m, torch.nn.Conv2d) for m in s2a.modules())
+        if n_conv2d == 0:
+            logger.info("TTS_CHANNELS_LAST set, but s2a has no Conv2d layers - skipping")
+            return
+
+        s2a.to(memory_format=torch.channels_last)
+        logger.info(f"s2a converted to channels_last ({n_conv2d} Conv2d layers)")
+
+    def _cast_weights(self, dtype: torch.dtype):
+        """
+        Cast t2s/s2a weights to dtype, keeping FP32 if a probe generation fails.
+
+        Runs before compilation so the compiled graphs see the final dtypes.
+        """
+        names = [n for n in ("t2s", "s2a") if isinstance(getattr(self.model, n, None), torch.nn.Module)]
+        if not names:
+            return
+
+        for name in names:
+            getattr(self.model, name).to(dtype=dtype)
+
+        try:
+            with self._autocast():
+                self.model.generate(Config.WARMUP_TEXT)
+            logger.info(f"Cast {names} weights to {dtype}")
+        except Exception as e:
+            logger.warning(f"{dtype} weights failed ({e}), keeping {names} in FP32")
+            for name in names:
+                getattr(self.model, name).float()
+
+    def _resolve_autocast_dtype(self) -> Optional[torch.dtype]:
+        """Map Config.INFERENCE_DTYPE to an autocast dtype (None = no autocast)."""
+        if not self.device.startswith("cuda") or not torch.cuda.is_available():
+            return None
+
+        dtype = Config.INFERENCE_DTYPE
+        if dtype == "auto":
+            # Native bf16 needs Ampere+ (sm_80). is_bf16_supported() also counts
+            # emulated bf16, which reports True on Turing (e.g. RTX 2070)
+            major, _ = torch.cuda.get_device_capability(self.device)
+            return torch.bfloat16 if major >= 8 else None
+
+        dtypes = {"fp32": None, "bfloat16": torch.bfloat16, "bf16": torch.bfloat16, "fp16": torch.float16}
+        if dtype not in dtypes:
+            logger.warning(f"Unknown TTS_DTYPE '{dtype}', using fp32")
+            return None
+        return dtypes[dtype]
+
+    def _autocast(self):
+        """Autocast context for inference (no-op when running full precision)."""
+        if self.autocast_dtype is None:
+            return nullcontext()
+        return torch.autocast(device_type="cuda", dtype=self.autocast_dtype)
+
+    @staticmethod
+    def _configure_inductor():
+        """
+        Turn on inductor's on-disk FX graph cache (dir set via TORCHINDUCTOR_CACHE_DIR)
+        and the extra autotuning passes when compiling in max-autotune mode.
+        """
+        try:
+            import torch._inductor.config as inductor_config
+            inductor_config.fx_graph_cache = True
+            inductor_config.force_disable_caches = False
+            if Config.COMPILE_MODE.startswith("max-autotune"):
+                inductor_config.max_autotune_gemm = True
+                inductor_config.coordinate_descent_tuning = True
+            logger.info(f"Inductor cache: {os.environ['TORCHINDUCTOR_CACHE_DIR']}")
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Could not configure inductor: {e}")
+
+    @staticmethod
+    def _load_compile_artifacts():
+        """
+        Preload the compile artifact bundle saved by a previous start.
+
+        torch.compiler's mega-cache (PyTorch 2.6+) packs inductor/Triton
+        kernels and autotuning results into one file, so compilation during
+        warmup becomes cache hits even on a fresh cache volume.
+        """
+        path = Config.COMPILE_ARTIFACTS_PATH
+        if path is None or not path.is_file() or not hasattr(torch.compiler, "load_cache_artifacts"):
+            return
+        try:
+            torch.compiler.load_cache_artifacts(path.read_bytes())
+            logger.info(f"Loaded compile artifacts from {path}")
+        except Exception as e:
+            logger.warning(f"Could not load compile artifacts from {path}: {e}")
+
+    @staticmethod
+    def _save_compile_artifacts():
+        """Write this start's compiled artifacts to Config.COMPILE_ARTIFACTS_PATH."""
+        path = Config.COMPILE_ARTIFACTS_PATH
+        if path is None or not hasattr(torch.compiler, "save_cache_artifacts"):
+            return
+        try:
+            saved = torch.compiler.save_cache_artifacts()
+            if saved is None:
+                return
+            data, _ = saved
+            path.parent.mkdir(parents=True, exist_ok=True)
+            part_path = path.with_name(path.name + ".part")
+            part_path.write_bytes(data)
+            os.replace(part_path, path)
+            logger.info(f"Saved {len(data) / 1024**2:.1f} MB of compile artifacts to {path}")
+        except Exception as e:
+            logger.warning(f"Could not save compile artifacts to {path}: {e}")
+
+    def _compile(self, fullgraph: bool):
+        """
+        Compile t2s/s2a with dynamo's automatic dynamic shapes: after the
+        first length it sees, the token-length dims become symbolic, so new
+        lengths reuse the compiled graph instead of recompiling.
+
+        Compilation is lazy, so with fullgraph=True one generation is traced
+        here to surface graph breaks; if that fails, the eager modules are
+        recompiled with fullgraph=False. Called inside load()'s autocast block.
+        """
+        eager = {
+            name: getattr(self.model, name)
+            for name in ("t2s", "s2a")
+            if getattr(self.model, name, None) is not None
+        }
+        if not eager:
+            logger.warning("No compilable submodules (t2s/s2a) found on model")
+            return
+
+        for name, module in eager.items():
+            setattr(self.model, name, torch.compile(
+                module, mode=Config.COMPILE_MODE, fullgraph=fullgraph
+            ))
+
+        if not fullgraph:
+            return
+
+        try:
+            self.model.generate(Config.WARMUP_TEXT)
+        except Exception as e:
+            if isinstance(e, torch._dynamo.exc.Unsupported):
+                # Message names the unsupported op and where it was hit
+                logger.warning(f"Graph break in compiled model: {e}")
+            logger.warning(
+                f"fullgraph=True trace failed, falling back to fullgraph=False "
+                f"({type(e).__name__}). Set TTS_LOG_GRAPH_BREAKS=true for details."
+            )
+            torch._dynamo.reset()
+            for name, module in eager.items():
+                setattr(self.model, name, torch.compile(
+                    module, mode=Config.COMPILE_MODE, fullgraph=False
+                ))
+
+    @staticmethod
+    def _first_param_device(submodule) -> Optional[str]:
+        """Device of a module's first parameter (None if it has no parameters)."""
+        param = next(iter(submodule.parameters()), None)
+        return str(param.device) if param is not None else None
+
     def _verify_device(self):
         """Verify the model components are on the expected device."""
         try:
-            # Check various model components to verify device placement
-            devices_found = set()
-
-            # Check t2s (text-to-semantic) model
-            if hasattr(self.model, 't2s') and self.model.t2s is not None:
-                for param in self.model.t2s.parameters():
-                    devices_found.add(str(param.device))
-                    break  # Just check first param
-
-            # Check s2a (semantic-to-acoustic) model
-            if hasattr(self.model, 's2a') and self.model.s2a is not None:
-                for param in self.model.s2a.parameters():
-                    devices_found.add(str(param.device))
-                    break
-
-            # Check ve (voice encoder) if present
-            if hasattr(self.model, 've') and self.model.ve is not None:
-                for param in self.model.ve.parameters():
-                    devices_found.add(str(param.device))
-                    break
+            # Check t2s (text-to-semantic), s2a (semantic-to-acoustic) and
+            # ve (voice encoder) - first parameter of each is enough
+            self.device_map = {
+                name: device
+                for name in ("t2s", "s2a", "ve")
+                if getattr(self.model, name, None) is not None
+                and (device := self._first_param_device(getattr(self.model, name))) is not None
+            }
+            devices_found = set(self.device_map.values())
 
             if devices_found:
-                logger.info(f"Model components on device(s): {devices_found}")
-                if self.device == "cuda" and not any("cuda" in d for d in devices_found):
+                logger.info(f"Model components on device(s): {self.device_map}")
+                on_cuda = self.device.startswith("cuda")  # "cuda" or "cuda:N"
+                if on_cuda and not any("cuda" in d for d in devices_found):
                     logger.error("⚠️ WARNING: Model requested CUDA but components are on CPU!")
-                elif self.device == "cuda":
+                elif on_cuda:
                     logger.info("✓ Model confirmed on CUDA")
             else:
                 logger.warning("Could not verify model device placement")
@@ -353,26 +1025,163 @@ class TTSModel:
             logger.warning(f"Device verification failed: {e}")
 
     def _warmup(self):
-        """Run warmup inferences to prime CUDA kernels and torch.compile."""
+        """
+        Run warmup inferences to prime CUDA kernels and torch.compile.
+
+        Called inside load()'s autocast block, together with compilation.
+        Skipped on CPU, where there are no kernels or graphs to prime.
+        """
+        if not self.device.startswith("cuda"):
+            logger.info(f"Skipping warmup on {self.device}")
+            return
+
         logger.info(f"Running {Config.WARMUP_ITERATIONS} warmup iterations...")
 
+        # Cycle through realistic utterance lengths rather than repeating one
+        # short placeholder, so the first long live request isn't a new shape
+        texts = Config.WARMUP_CORPUS or (Config.WARMUP_TEXT,)
+
         try:
-            with torch.inference_mode():
-                for i in range(Config.WARMUP_ITERATIONS):
-                    start = time.perf_counter()
-                    _ = self.model.generate(Config.WARMUP_TEXT)
-                    warmup_ms = (time.perf_counter() - start) * 1000
-
-                    if i == 0:
-                        logger.info(f"Warmup {i+1}/{Config.WARMUP_ITERATIONS}: {warmup_ms:.0f}ms (first run, compiling)")
-                    else:
-                        logger.info(f"Warmup {i+1}/{Config.WARMUP_ITERATIONS}: {warmup_ms:.0f}ms")
-
-                # Report expected performance from last warmup
-                logger.info(f"Warmup complete. Expected inference time: ~{warmup_ms:.0f}ms")
+            for i in range(Config.WARMUP_ITERATIONS):
+                text = texts[i % len(texts)]
+                start = time.perf_counter()
+                out = self.model.generate(text)
+                warmup_ms = (time.perf_counter() - start) * 1000
+
+                if i == 0:
+                    self._set_output_contract(out)
+
+                label = f"{len(text)} chars" + (", first run, compiling" if i == 0 else "")
+                logger.info(f"Warmup {i+1}/{Config.WARMUP_ITERATIONS}: {warmup_ms:.0f}ms ({label})")
+
+            # Report expected performance from last warmup
+            logger.info(f"Warmup complete. Expected inference time: ~{warmup_ms:.0f}ms ({len(text)} chars)")
+
+            if Config.USE_TORCH_COMPILE:
+                # Run a spread of token lengths so dynamic shapes kick in now
+                if Config.WARMUP_TOKEN_BUCKETS:
+                    self._warmup_buckets()
+                # ...and for realistic text with the sampling params clients use
+                if Config.WARMUP_CORPUS and Config.WARMUP_PARAMS:
+                    self._warmup_corpus()
         except Exception as e:
             logger.warning(f"Warmup failed (non-fatal): {e}")
 
+    def _set_output_contract(self, audio: torch.Tensor):
+        """Install the post-processor matching the model's output rank."""
+        if audio.dim() == 2:
+            self._to_2d = _identity
+        elif audio.dim() == 1:
+            self._to_2d = _unsqueeze0
+        logger.info(f"Model output shape: {tuple(audio.shape)} (rank {audio.dim()})")
+
+    def _warmup_buckets(self):
+        """Run one inference per token-length bucket (called from _warmup)."""
+        start = time.perf_counter()
+        for n_tokens in Config.WARMUP_TOKEN_BUCKETS:
+            bucket_start = time.perf_counter()
+            _ = self.model.generate(self._text_for_token_bucket(n_tokens))
+            logger.info(
+                f"Warmup bucket {n_tokens} tokens: {(time.perf_counter() - bucket_start) * 1000:.0f}ms"
+            )
+        logger.info(
+            f"Bucket warmup complete ({len(Config.WARMUP_TOKEN_BUCKETS)} buckets) "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+
+    def _warmup_corpus(self):
+        """Run the warmup corpus under each (exaggeration, cfg_weight) pair (called from _warmup)."""
+        start = time.perf_counter()
+        for exaggeration, cfg_weight in Config.WARMUP_PARAMS:
+            for text in Config.WARMUP_CORPUS:
+                _ = self.model.generate(text, exaggeration=exaggeration, cfg_weight=cfg_weight)
+        logger.info(
+            f"Corpus warmup complete ({len(Config.WARMUP_CORPUS)} texts x "
+            f"{len(Config.WARMUP_PARAMS)} param sets) in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+
+    def _text_for_token_bucket(self, n_tokens: int) -> str:
+        """
+        Build filler text that tokenizes to roughly n_tokens.
+
+        Uses the model's tokenizer when it exposes encode(), otherwise
+        estimates ~4 characters per token.
+        """
+        filler = Config.WARMUP_FILLER.split()
+        words = []
+
+        while True:
+            words.append(filler[len(words) % len(filler)])
+            text = " ".join(words)
+            if self.count_tokens(text) >= n_tokens:
+                return text
+
+    def _private_encode(self):
+        """
+        encode() of a copy of the model's tokenizer, or None.
+
+        Fast tokenizers raise "Already borrowed" when one instance is used
+        from two threads. generate() tokenizes with the model's own instance
+        on tts_executor; this copy is used by split_text() on the single
+        text_executor thread (and by warmup, before any request runs).
+        """
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if not hasattr(tokenizer, "encode"):
+            return None
+        try:
+            return copy.deepcopy(tokenizer).encode
+        except Exception as e:
+            logger.warning(f"Could not copy tokenizer ({e}), estimating token counts")
+            return None
+
+    def count_tokens(self, text: str) -> int:
+        """Token count from the model's tokenizer, or ~4 characters per token."""
+        if self._encode is not None:
+            try:
+                return len(self._encode(text))
+            except (AttributeError, TypeError):
+                # encode() doesn't take plain text - stop trying
+                self._encode = None
+            except Exception as e:
+                logger.warning(f"Tokenizer failed ({e}), estimating token count")
+        return len(text) // 4
+
+    @property
+    def streams_natively(self) -> bool:
+        """Whether the loaded model yields audio chunks itself (generate_stream)."""
+        return hasattr(self.model, "generate_stream")
+
+    def split_text(self, text: str, limit: Optional[int] = None) -> list:
+        """
+        Split text into segments of at most limit tokens (default
+        Config.MAX_TEXT_TOKENS).
+
+        Packs whole sentences greedily; a single sentence that is still too
+        long is split between words. Returns [text] when it already fits.
+        """
+        if limit is None:
+            limit = Config.MAX_TEXT_TOKENS
+        if limit <= 0 or self.count_tokens(text) <= limit:
+            return [text]
+
+        segments = []
+        current = ""
+        for sentence in re.split(r"(?<=[.!?;:])\s+", text.strip()):
+            pieces = [sentence]
+            if self.count_tokens(sentence) > limit:
+                pieces = sentence.split()
+
+            for piece in pieces:
+                candidate = f"{current} {piece}" if current else piece
+                if current and self.count_tokens(candidate) > limit:
+                    segments.append(current)
+                    candidate = piece
+                current = candidate
+
+        if current:
+            segments.append(current)
+        return segments
+
     def generate(
         self,
         text: str,
@@ -395,14 +1204,134 @@ class TTSModel:
         if not self.is_ready or self.model is None:
             raise RuntimeError("Model not loaded")
 
-        # Use inference_mode for faster execution (no gradient tracking)
-        with torch.inference_mode():
-            return self.model.generate(
-                text,
-                audio_prompt_path=audio_prompt_path,
-                exaggeration=exaggeration,
-                cfg_weight=cfg_weight,
-            )
+        # Run under the same autocast state the model was compiled/warmed with
+        # (inference mode is already on for the tts_executor thread)
+        try:
+            with self._autocast():
+                audio_prompt_path = self._select_voice(audio_prompt_path, exaggeration)
+                return self._to_2d(self.model.generate(
+                    text,
+                    audio_prompt_path=audio_prompt_path,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                ))
+        finally:
+            self._release_cached_vram()
+
+    def _select_voice(self, audio_prompt_path: Optional[str], exaggeration: float) -> Optional[str]:
+        """
+        Install the conditionals for a voice on the model, from cache if possible.
+
+        Returns the audio_prompt_path to pass on to model.generate(): None once
+        conditionals are installed, or the path unchanged when caching is off
+        or the model can't prepare conditionals separately. Call from the
+        tts_executor thread.
+        """
+        if Config.VOICE_CONDS_CACHE_SIZE <= 0 or not hasattr(self.model, "prepare_conditionals"):
+            return audio_prompt_path
+
+        if audio_prompt_path is None:
+            # An earlier request may have left another voice installed
+            self.model.conds = self._default_conds
+            return None
+
+        try:
+            key = (audio_prompt_path, os.stat(audio_prompt_path).st_mtime_ns)
+        except OSError:
+            return audio_prompt_path  # Let the model report the missing file
+
+        conds = self._conds_cache.get(key)
+        if conds is not None:
+            self._conds_cache.move_to_end(key)
+            self.model.conds = conds
+            return None
+
+        self.model.prepare_conditionals(audio_prompt_path, exaggeration=exaggeration)
+        self._conds_cache[key] = self.model.conds
+        while len(self._conds_cache) > Config.VOICE_CONDS_CACHE_SIZE:
+            self._conds_cache.popitem(last=False)
+        return None
+
+    def generate_chunks(
+        self,
+        text: str,
+        audio_prompt_path: Optional[str] = None,
+        exaggeration: float = 0.5,
+        cfg_weight: float = 0.5,
+    ) -> Iterator[torch.Tensor]:
+        """
+        Generate speech as a sequence of audio chunks.
+
+        Uses the model's generate_stream() when it has one (some Chatterbox
+        builds do); otherwise generates the full utterance and slices it.
+        Advance with next_chunk() so each step runs under autocast.
+        """
+        if not self.is_ready or self.model is None:
+            raise RuntimeError("Model not loaded")
+
+        audio_prompt_path = self._select_voice(audio_prompt_path, exaggeration)
+        kwargs = dict(
+            audio_prompt_path=audio_prompt_path,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+        )
+
+        if self.streams_natively:
+            for chunk in self.model.generate_stream(text, **kwargs):
+                # Some implementations yield (audio, metrics) tuples
+                yield chunk[0] if isinstance(chunk, tuple) else chunk
+            return
+
+        audio = self.model.generate(text, **kwargs).reshape(-1)
+        for start in range(0, audio.shape[-1], Config.STREAM_CHUNK_SAMPLES):
+            yield audio[start:start + Config.STREAM_CHUNK_SAMPLES]
+
+    def next_chunk(self, chunks: Iterator[torch.Tensor]) -> Optional[bytes]:
+        """Advance a generate_chunks() iterator; returns PCM16 bytes or None when done."""
+        with self._autocast():
+            chunk = next(chunks, None)
+            if chunk is None:
+                self._release_cached_vram()
+                return None
+            return self.to_pcm16(chunk).numpy().tobytes()
+
+    def _release_cached_vram(self):
+        """Empty the CUDA allocator cache once its idle part passes the threshold."""
+        limit = Config.CUDA_RELEASE_THRESHOLD_MB * 1024**2
+        if limit <= 0 or not self.device.startswith("cuda") or not torch.cuda.is_available():
+            return
+        if torch.cuda.memory_reserved() - torch.cuda.memory_allocated() > limit:
+            torch.cuda.empty_cache()
+
+    def start_pcm16_copy(self, audio: torch.Tensor) -> tuple:
+        """
+        Quantize generated audio to PCM16 where it lives, then start copying
+        it to the CPU as a flat int16 tensor.
+
+        Quantizing first halves the bytes crossing PCIe and keeps the
+        clamp/scale off the CPU. CUDA audio is copied non-blocking (DMA) into
+        the pinned staging buffer, which is reused across requests. Returns
+        (tensor, event): call event.synchronize() right before reading the
+        tensor (event is None when the copy was synchronous). Only call this
+        from the single tts_executor thread, and finish with the tensor
+        before the next generation.
+        """
+        pcm = _pcm16(audio)
+        n = pcm.numel()
+        if pcm.device.type != "cuda" or self._cpu_pinned is None or n > self._cpu_pinned.numel():
+            return pcm.cpu(), None
+
+        staged = self._cpu_pinned[:n]
+        staged.copy_(pcm, non_blocking=True)
+        self._copy_done.record()
+        return staged, self._copy_done
+
+    def to_pcm16(self, audio: torch.Tensor) -> torch.Tensor:
+        """Quantize and copy generated audio to the CPU, waiting for it (see start_pcm16_copy)."""
+        pcm, ready = self.start_pcm16_copy(audio)
+        if ready is not None:
+            ready.synchronize()
+        return pcm
 
     @property
     def sample_rate(self) -> int:
@@ -416,39 +1345,76 @@ class TTSModel:
 # FastAPI App
 # ============================================================================
 
+async def _resync_voice_cache_loop():
+    """Periodically resync the voice cache index with the directory."""
+    while True:
+        await asyncio.sleep(Config.VOICE_CACHE_RESYNC_S)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, voice_cache.resync)
+        except Exception as e:
+            logger.warning(f"Voice cache resync failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle."""
-    global voice_cache
+    global voice_cache, tts_executor, gpu_gate, text_executor
 
     # Startup: Initialize voice cache
     voice_cache = VoiceCache(Config.VOICE_CACHE_DIR)
+    resync_task = asyncio.create_task(_resync_voice_cache_loop())
+
+    # Startup: Inference executor (GPU is the bottleneck, so one worker)
+    tts_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="tts", initializer=_init_tts_thread
+    )
+    gpu_gate = GpuGate(Config.MAX_QUEUED_REQUESTS)
+    text_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-text")
 
     # Startup: Load model
     logger.info("=" * 60)
     logger.info("EDDA TTS Service Starting")
     logger.info(f"Device: {Config.DEVICE}")
     logger.info(f"CUDA Available: {torch.cuda.is_available()}")
-    if torch.cuda.is_available():
-        logger.info(f"CUDA Device: {torch.cuda.get_device_name(0)}")
-        logger.info(f"VRAM: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.1f} GB")
+
+    # Device name and VRAM size never change - query once for /health
+    app.state.cuda_available = torch.cuda.is_available()
+    app.state.cuda_device_name = None
+    app.state.vram_total_gb = None
+    if app.state.cuda_available:
+        app.state.cuda_device_name = torch.cuda.get_device_name(0)
+        app.state.vram_total_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
+        logger.info(f"CUDA Device: {app.state.cuda_device_name}")
+        logger.info(f"VRAM: {app.state.vram_total_gb:.1f} GB")
     logger.info("=" * 60)
 
     model = TTSModel.get_instance()
 
-    # Try loading with retries (blocks startup for up to ~10 min worst case)
-    if not model.load_with_retry():
-        logger.error(
-            "Model failed to load after all retries - starting background retry. "
-            "Service will return 503 on /tts until model loads."
-        )
-        # Start background task that keeps trying forever
-        await model.start_background_retry()
+    async def load_model():
+        # Try loading with retries (up to ~10 min worst case) on the inference
+        # thread, so compile/warmup share its thread-local inference state
+        loaded = await asyncio.get_running_loop().run_in_executor(tts_executor, model.load_with_retry)
+        if not loaded:
+            logger.error(
+                "Model failed to load after all retries - starting background retry. "
+                "Service will return 503 on /tts until model loads."
+            )
+            # Start background task that keeps trying forever
+            await model.start_background_retry()
+
+    # Load in the background so the server answers /health immediately;
+    # it reports model_loaded=false / "unhealthy" until the model is ready
+    load_task = asyncio.create_task(load_model())
 
     yield
 
     # Shutdown: Cleanup
+    load_task.cancel()
+    resync_task.cancel()
     model.stop_background_retry()
+    # Waits at most for a load attempt already in progress (retries are stopped)
+    tts_executor.shutdown(wait=True, cancel_futures=True)
+    text_executor.shutdown(wait=False, cancel_futures=True)
     logger.info("TTS Service shutting down")
 
 
@@ -457,6 +1423,7 @@ app = FastAPI(
     description="Text-to-speech synthesis using Chatterbox Turbo",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -494,6 +1461,39 @@ class TTSRequest(BaseModel):
         description="Classifier-free guidance weight",
     )
 
+    @classmethod
+    def from_body(cls, body: bytes) -> "TTSRequest":
+        """
+        Parse a /tts JSON body without full Pydantic validation.
+
+        The only caller is the trusted C# server, so this does the same bounds
+        checks by hand and builds the model with model_construct().
+        """
+        try:
+            raw = orjson.loads(body)
+            text = raw["text"]
+            voice_id = raw.get("voice_id")
+            voice_reference = raw.get("voice_reference")
+            exaggeration = float(raw.get("exaggeration", 0.5))
+            cfg_weight = float(raw.get("cfg_weight", 0.5))
+        except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=f"Invalid request body: {e}")
+
+        if not isinstance(text, str) or not 1 <= len(text) <= 5000:
+            raise HTTPException(status_code=422, detail="text must be a string of 1-5000 characters")
+        if not (0.0 <= exaggeration <= 1.0 and 0.0 <= cfg_weight <= 1.0):
+            raise HTTPException(status_code=422, detail="exaggeration and cfg_weight must be within [0, 1]")
+        if not all(v is None or isinstance(v, str) for v in (voice_id, voice_reference)):
+            raise HTTPException(status_code=422, detail="voice_id and voice_reference must be strings")
+
+        return cls.model_construct(
+            text=text,
+            voice_id=voice_id,
+            voice_reference=voice_reference,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+        )
+
 
 class HealthResponse(BaseModel):
     """Response body for /health endpoint."""
@@ -508,6 +1508,8 @@ class HealthResponse(BaseModel):
     load_time_ms: Optional[float] = None
     last_error: Optional[str] = None
     cached_voices: int = 0
+    queued_requests: int = 0
+    device_map: dict = {}
 
 
 class VoiceCacheStatus(BaseModel):
@@ -521,7 +1523,10 @@ class VoiceCacheStatus(BaseModel):
 # Endpoints
 # ============================================================================
 
-@app.get("/health", response_model=HealthResponse)
+# /health and GET /voice return plain dicts (schemas kept for the OpenAPI docs)
+# so frequent polling skips per-field Pydantic validation.
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     Health check endpoint.
@@ -531,36 +1536,33 @@ async def health_check():
     """
     model = TTSModel.get_instance()
 
-    cuda_device = None
-    vram_total = None
+    # Static device info is cached at startup; only usage is queried live
+    vram_total = app.state.vram_total_gb
     vram_used = None
 
-    if torch.cuda.is_available():
-        cuda_device = torch.cuda.get_device_name(0)
-        props = torch.cuda.get_device_properties(0)
-        vram_total = props.total_memory / 1024**3
+    if app.state.cuda_available:
         vram_used = torch.cuda.memory_allocated(0) / 1024**3
 
-    # Count cached voices
-    cached_count = 0
-    if voice_cache:
-        cached_count = len(list(voice_cache.cache_dir.glob("*.wav")))
-
-    return HealthResponse(
-        status="healthy" if model.is_ready else "unhealthy",
-        model_loaded=model.is_ready,
-        device=model.device,
-        cuda_available=torch.cuda.is_available(),
-        cuda_device=cuda_device,
-        vram_total_gb=round(vram_total, 2) if vram_total else None,
-        vram_used_gb=round(vram_used, 2) if vram_used else None,
-        load_time_ms=round(model.load_time_ms, 0) if model.load_time_ms else None,
-        last_error=model.last_error,
-        cached_voices=cached_count,
-    )
+    # Count cached voices (in-memory index, no directory scan)
+    cached_count = voice_cache.count if voice_cache else 0
+
+    return {
+        "status": "healthy" if model.is_ready else "unhealthy",
+        "model_loaded": model.is_ready,
+        "device": model.device,
+        "cuda_available": app.state.cuda_available,
+        "cuda_device": app.state.cuda_device_name,
+        "vram_total_gb": round(vram_total, 2) if vram_total else None,
+        "vram_used_gb": round(vram_used, 2) if vram_used else None,
+        "load_time_ms": round(model.load_time_ms, 0) if model.load_time_ms else None,
+        "last_error": model.last_error,
+        "cached_voices": cached_count,
+        "queued_requests": gpu_gate.waiting if gpu_gate else 0,
+        "device_map": model.device_map,
+    }
 
 
-@app.get("/voice/{voice_id}", response_model=VoiceCacheStatus)
+@app.get("/voice/{voice_id}", responses={200: {"model": VoiceCacheStatus}})
 async def check_voice(voice_id: str):
     """
     Check if a voice is cached.
@@ -574,11 +1576,11 @@ async def check_voice(voice_id: str):
     cached = voice_cache.exists(voice_id)
     path = str(voice_cache.get(voice_id)) if cached else None
 
-    return VoiceCacheStatus(
-        voice_id=voice_id,
-        cached=cached,
-        path=path,
-    )
+    return {
+        "voice_id": voice_id,
+        "cached": cached,
+        "path": path,
+    }
 
 
 @app.post("/voice/{voice_id}")
@@ -599,51 +1601,114 @@ async def upload_voice(voice_id: str, file: UploadFile = File(...)):
     if not voice_cache:
         raise HTTPException(status_code=503, detail="Voice cache not initialized")
 
-    # Read the uploaded file
-    audio_data = await file.read()
+    # Read just the header - the body is streamed to disk below
+    header = await file.read(12)
 
-    if len(audio_data) == 0:
+    if len(header) == 0:
         raise HTTPException(status_code=400, detail="Empty file uploaded")
 
-    # Verify it's actually audio (basic check - starts with RIFF for WAV)
-    if not audio_data[:4] == b'RIFF':
+    # Verify it's actually audio (basic check - RIFF....WAVE)
+    if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
         raise HTTPException(
             status_code=400,
             detail="Invalid audio format. Expected WAV file."
         )
 
+    # Spool to cache, hashing as we go (file I/O off the event loop)
+    path, size_bytes, computed_hash = await asyncio.get_running_loop().run_in_executor(
+        None, voice_cache.store, voice_id, file.file, header, Config.VERIFY_UPLOAD_HASH
+    )
+
     # Optional: verify the voice_id matches the content hash
     # (we could enforce this, but it's not strictly necessary)
-    computed_hash = VoiceCache.compute_hash(audio_data)
-    if voice_id != computed_hash:
+    if computed_hash is not None and voice_id != computed_hash:
         logger.warning(
             f"Voice ID mismatch: client sent '{voice_id}', computed '{computed_hash}'. "
-            "Storing with client-provided ID anyway."
+            "Stored with client-provided ID anyway."
         )
 
-    # Store in cache
-    path = voice_cache.store(voice_id, audio_data)
-
     return {
         "voice_id": voice_id,
         "path": str(path),
-        "size_bytes": len(audio_data),
+        "size_bytes": size_bytes,
         "computed_hash": computed_hash,
+        "hash_algo": VoiceCache.HASH_ALGO if computed_hash is not None else None,
     }
 
 
-@app.post("/tts")
-async def text_to_speech(request: TTSRequest):
+def _run_generation(request: TTSRequest, voice_path: Optional[str], segments: list) -> tuple:
+    """
+    Blocking generate + WAV encode (runs on tts_executor).
+
+    Args:
+        segments: request.text split by TTSModel.split_text()
+
+    Returns:
+        (wav_bytes, generation_ms, encode_ms, audio_duration_s)
+    """
+    model = TTSModel.get_instance()
+
+    # Generate audio (one call per segment, concatenated)
+    gen_start = time.perf_counter()
+    parts = [
+        model.generate(
+            text=segment,
+            audio_prompt_path=voice_path,
+            exaggeration=request.exaggeration,
+            cfg_weight=request.cfg_weight,
+        )
+        for segment in segments
+    ]
+    audio = parts[0] if len(parts) == 1 else torch.cat(parts, dim=-1)
+    generation_ms = (time.perf_counter() - gen_start) * 1000
+
+    # Convert to WAV bytes
+    encode_start = time.perf_counter()
+
+    # Quantize on the GPU and start the pinned, non-blocking GPU->CPU
+    # transfer; only wait on its event right before the samples are read
+    pcm, ready = model.start_pcm16_copy(audio)
+    # Drop the GPU output now so its buffers are free for the next request
+    # while we encode (stream ordering keeps the pending copy safe)
+    del audio, parts
+    wav_buffer = io.BytesIO()
+    if ready is not None:
+        ready.synchronize()
+
+    # Header + raw int16 samples (no libsndfile round trip)
+    _write_wav_pcm16(wav_buffer, pcm, model.sample_rate)
+    encode_ms = (time.perf_counter() - encode_start) * 1000
+
+    # Calculate audio duration from the CPU samples
+    audio_duration_s = pcm.numel() / model.sample_rate
+
+    return wav_buffer.getvalue(), generation_ms, encode_ms, audio_duration_s
+
+
+# The body is parsed by TTSRequest.from_body(), not FastAPI; the schema is
+# attached by hand so the OpenAPI docs still show it
+@app.post(
+    "/tts",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": TTSRequest.model_json_schema()}},
+        }
+    },
+)
+async def text_to_speech(http_request: Request, stream: bool = False):
     """
     Generate speech from text.
 
-    Returns streaming WAV audio (24kHz, 16-bit, mono).
+    Returns WAV audio (24kHz, 16-bit, mono). With ?stream=true the WAV header
+    is sent immediately (unknown-length sizes) and PCM follows chunk by chunk.
 
     Voice selection priority:
     1. voice_id - Look up cached voice by ID
     2. voice_reference - Use file path directly (legacy)
     3. None - Use default voice
     """
+    request = TTSRequest.from_body(await http_request.body())
     model = TTSModel.get_instance()
 
     if not model.is_ready:
@@ -677,43 +1742,59 @@ async def text_to_speech(request: TTSRequest):
 
     logger.info(f"TTS request: mode={voice_mode}, voice_path={voice_path!r}")
 
-    try:
-        total_start = time.perf_counter()
+    # Cache hits (non-streamed only) return before any tokenization
+    cache_key = None if stream else ResponseCache.key(request, voice_path)
+    cached = response_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        wav_bytes, audio_duration_s = cached
+        logger.info(f"TTS [cache hit] ({voice_mode}): {len(request.text)} chars -> {audio_duration_s:.2f}s audio")
+        return StreamingResponse(
+            io.BytesIO(wav_bytes),
+            media_type="audio/wav",
+            headers={
+                "X-Audio-Duration-S": f"{audio_duration_s:.2f}",
+                "X-Voice-Mode": voice_mode,
+                "X-Cache": "hit",
+            },
+        )
 
-        # Generate audio
-        gen_start = time.perf_counter()
-        audio = model.generate(
-            text=request.text,
-            audio_prompt_path=voice_path,
-            exaggeration=request.exaggeration,
-            cfg_weight=request.cfg_weight,
+    # Keep each model call within the warmed length range; when streaming
+    # without native model support, use short segments for a faster first chunk
+    split_limit = None
+    if stream and not model.streams_natively:
+        limits = [n for n in (Config.STREAM_SEGMENT_TOKENS, Config.MAX_TEXT_TOKENS) if n > 0]
+        split_limit = min(limits, default=0)
+
+    # Tokenize/split on text_executor before taking the GPU gate: keeps the
+    # event loop free and overlaps with the request currently generating
+    reservation = gpu_gate.reserve()
+    try:
+        segments = await asyncio.get_running_loop().run_in_executor(
+            text_executor, model.split_text, request.text, split_limit
         )
-        generation_ms = (time.perf_counter() - gen_start) * 1000
+    except BaseException:
+        reservation.release()
+        raise
+    if len(segments) > 1:
+        logger.info(f"Split {len(request.text)} chars into {len(segments)} segments")
 
-        # Convert to WAV bytes
-        encode_start = time.perf_counter()
-        wav_buffer = io.BytesIO()
+    if stream:
+        # The response owns the reservation from here
+        return _stream_tts(model, request, voice_path, voice_mode, segments, reservation)
 
-        # Ensure audio is 2D (1, samples)
-        if audio.dim() == 1:
-            audio = audio.unsqueeze(0)
+    try:
+        total_start = time.perf_counter()
 
-        # Move to CPU for saving (GPU->CPU transfer)
-        audio_cpu = audio.cpu()
+        # Generate + encode in the dedicated executor so the event loop stays responsive
+        async with gpu_gate.turn(reservation):
+            wav_bytes, generation_ms, encode_ms, audio_duration_s = await asyncio.get_running_loop().run_in_executor(
+                tts_executor, _run_generation, request, voice_path, segments
+            )
 
-        torchaudio.save(
-            wav_buffer,
-            audio_cpu,
-            model.sample_rate,
-            format="wav",
-        )
-        wav_buffer.seek(0)
-        encode_ms = (time.perf_counter() - encode_start) * 1000
+        if cache_key is not None:
+            response_cache.put(cache_key, wav_bytes, audio_duration_s)
 
         total_ms = (time.perf_counter() - total_start) * 1000
-
-        # Calculate audio duration
-        audio_duration_s = audio.shape[-1] / model.sample_rate
         rtf = generation_ms / (audio_duration_s * 1000)  # Real-time factor
 
         logger.info(
@@ -723,7 +1804,7 @@ async def text_to_speech(request: TTSRequest):
         )
 
         return StreamingResponse(
-            wav_buffer,
+            io.BytesIO(wav_bytes),
             media_type="audio/wav",
             headers={
                 "X-Generation-Time-Ms": str(int(generation_ms)),
@@ -732,12 +1813,88 @@ async def text_to_speech(request: TTSRequest):
                 "X-Encode-Time-Ms": str(int(encode_ms)),
                 "X-Total-Time-Ms": str(int(total_ms)),
                 "X-Voice-Mode": voice_mode,
+                "X-Cache": "miss",
             },
         )
 
     except Exception as e:
         logger.error(f"TTS generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        reservation.release()  # No-op once turn() took it
+
+
+class _ReservedStreamingResponse(StreamingResponse):
+    """StreamingResponse that frees its GpuGate reservation however it ends."""
+
+    def __init__(self, content, reservation: GpuReservation, **kwargs):
+        super().__init__(content, **kwargs)
+        self.reservation = reservation
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # The body may never start (client gone before headers were sent)
+            self.reservation.release()
+
+
+def _stream_tts(
+    model: TTSModel,
+    request: TTSRequest,
+    voice_path: Optional[str],
+    voice_mode: str,
+    segments: list,
+    reservation: GpuReservation,
+) -> StreamingResponse:
+    """Build a streaming WAV response that sends audio as chunks are generated."""
+
+    async def body() -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        first_chunk_ms = None
+        pcm_bytes = 0
+
+        chunks = (
+            chunk
+            for segment in segments
+            for chunk in model.generate_chunks(
+                text=segment,
+                audio_prompt_path=voice_path,
+                exaggeration=request.exaggeration,
+                cfg_weight=request.cfg_weight,
+            )
+        )
+
+        yield _stream_wav_header(model.sample_rate)
+
+        # Hold the GPU across all chunks so other requests don't interleave
+        async with gpu_gate.turn(reservation):
+            try:
+                while True:
+                    pcm = await loop.run_in_executor(tts_executor, model.next_chunk, chunks)
+                    if pcm is None:
+                        break
+                    if first_chunk_ms is None:
+                        first_chunk_ms = (time.perf_counter() - start) * 1000
+                    pcm_bytes += len(pcm)
+                    yield pcm
+            except Exception as e:
+                # Headers are already sent - all we can do is log and end the body
+                logger.error(f"TTS streaming failed: {e}")
+                return
+            finally:
+                # Release the generator on the inference thread (client may have gone away)
+                tts_executor.submit(chunks.close)
+
+        generation_ms = (time.perf_counter() - start) * 1000
+        audio_duration_s = pcm_bytes / (2 * model.sample_rate)
+        logger.info(
+            f"TTS [{model.device}/stream] ({voice_mode}): {len(request.text)} chars -> {audio_duration_s:.2f}s audio | "
+            f"first={first_chunk_ms or 0:.0f}ms, gen={generation_ms:.0f}ms"
+        )
+
+    return _ReservedStreamingResponse(body(), reservation, media_type="audio/wav")
 
 
 @app.get("/")
@@ -748,7 +1905,7 @@ async def root():
         "model": "Chatterbox Turbo",
         "endpoints": {
             "/health": "GET - Health check",
-            "/tts": "POST - Text-to-speech synthesis",
+            "/tts": "POST - Text-to-speech synthesis (?stream=true for chunked PCM)",
             "/voice/{voice_id}": "GET - Check if voice is cached, POST - Upload voice for caching",
         },
     }
@@ -761,9 +1918,17 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop/httptools come with uvicorn[standard]; requests are logged by
+    # hand in /tts, so the per-request access log is off. One worker: each
+    # extra process would load (and compile) its own copy of the model on the
+    # same GPU; concurrency comes from the event loop plus tts_executor.
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=Config.PORT,
         log_level=Config.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        workers=1,
+        access_log=False,
     )